@@ -7,8 +7,20 @@ __version__ = "1.0.0"
 __author__ = "PHINEAS Team"
 __description__ = "Comprehensive OSINT automation framework"
 
-from .orchestrator import PhineasOrchestrator
-from .config_manager import ConfigManager
-from .result_aggregator import ResultAggregator
-
 __all__ = ['PhineasOrchestrator', 'ConfigManager', 'ResultAggregator']
+
+# Submodules are imported on first attribute access so that lightweight
+# commands do not pay for rich/keyring/dotenv at startup
+_LAZY_IMPORTS = {
+    'PhineasOrchestrator': '.orchestrator',
+    'ConfigManager': '.config_manager',
+    'ResultAggregator': '.result_aggregator',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        module = import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,12 +5,21 @@ Handles API keys, credentials, and configuration
 """
 
 import os
-import json
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
-import keyring
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Final
+
+from .file_cache import load_yaml_cached, invalidate_cache, YamlDumper
+from .serialization import json_loads
+
+# Services reported by list_api_keys
+_SUPPORTED_SERVICES: Final[Tuple[str, ...]] = (
+    'shodan', 'securitytrails', 'haveibeenpwned', 'virustotal',
+    'hunter', 'snusbase', 'dehashed', 'censys', 'github',
+    'twitter', 'numverify', 'clearbit'
+)
 
 
 class ConfigManager:
@@ -24,6 +33,10 @@ class ConfigManager:
     - Cronos ops.json integration
     """
     
+    # Parsed Cronos ops.json shared across instances, validated by mtime
+    _cronos_cache: Dict[Path, Tuple[float, Dict]] = {}
+    _cronos_path: Optional[Path] = None
+    
     def __init__(self, config_dir: Optional[Path] = None):
         self.config_dir = config_dir or Path.home() / '.phineas'
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -32,15 +45,29 @@ class ConfigManager:
         self.env_file = self.config_dir / '.env'
         
         # Load environment variables
+        from dotenv import load_dotenv
         load_dotenv(self.env_file)
         
+        self._config_lock = threading.RLock()
+        self._config_dirty = False
+        self._defer_saves = False
+        self._observer = None
+        self._reload_timer = None
+        
         self.config = self._load_config()
+        
+        # Resolved API keys, keyed by service name
+        self._api_key_cache: Dict[str, Optional[str]] = {}
+        
+        # All phineas keyring entries, fetched in one call on supporting backends
+        self._keyring_lock = threading.Lock()
+        self._keyring_entries: Optional[Dict[str, str]] = None
+        self._keyring_prefetched = False
     
     def _load_config(self) -> Dict:
         """Load configuration from file"""
         if self.config_file.exists():
-            with open(self.config_file) as f:
-                return yaml.safe_load(f) or {}
+            return load_yaml_cached(self.config_file) or {}
         return self._default_config()
     
     def _default_config(self) -> Dict:
@@ -68,9 +95,19 @@ class ConfigManager:
         }
     
     def save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file if it has unsaved changes"""
+        if not self._config_dirty:
+            return
+        
         with open(self.config_file, 'w') as f:
-            yaml.dump(self.config, f, default_flow_style=False)
+            yaml.dump(self.config, f, Dumper=YamlDumper, default_flow_style=False)
+        self._config_dirty = False
+    
+    def _config_changed(self):
+        """Record a config mutation and persist it unless saves are deferred"""
+        self._config_dirty = True
+        if not self._defer_saves:
+            self.save_config()
     
     def get_api_key(self, service: str) -> Optional[str]:
         """
@@ -81,7 +118,19 @@ class ConfigManager:
         2. System keyring
         3. Config file
         4. Cronos ops.json
+        
+        Results are cached per service until the key is changed through
+        set_api_key() or remove_api_key().
         """
+        if service in self._api_key_cache:
+            return self._api_key_cache[service]
+        
+        api_key = self._lookup_api_key(service)
+        self._api_key_cache[service] = api_key
+        return api_key
+    
+    def _lookup_api_key(self, service: str) -> Optional[str]:
+        """Resolve an API key from the configured backends"""
         # 1. Check environment variable
         env_var = f"PHINEAS_{service.upper()}_API_KEY"
         api_key = os.getenv(env_var)
@@ -90,7 +139,12 @@ class ConfigManager:
         
         # 2. Check system keyring
         try:
-            api_key = keyring.get_password('phineas', service)
+            keyring_entries = self._keyring_prefetch()
+            if keyring_entries is not None:
+                api_key = keyring_entries.get(service)
+            else:
+                import keyring
+                api_key = keyring.get_password('phineas', service)
             if api_key:
                 return api_key
         except Exception:
@@ -99,8 +153,8 @@ class ConfigManager:
         # 3. Check config file
         api_key = self.config.get('api_keys', {}).get(service, {})
         if isinstance(api_key, dict):
-            return api_key.get('key')
-        elif isinstance(api_key, str):
+            api_key = api_key.get('key')
+        if isinstance(api_key, str) and api_key:
             return api_key
         
         # 4. Check Cronos ops.json
@@ -110,29 +164,95 @@ class ConfigManager:
         
         return None
     
+    def _keyring_prefetch(self) -> Optional[Dict[str, str]]:
+        """
+        Fetch every phineas keyring entry in a single backend call
+        
+        Only the Secret Service backend (GNOME Keyring, KWallet) supports
+        searching by attribute; for other backends, or a locked collection,
+        None is returned and callers fall back to keyring.get_password().
+        """
+        with self._keyring_lock:
+            if self._keyring_prefetched:
+                return self._keyring_entries
+            
+            self._keyring_prefetched = True
+            self._keyring_entries = None
+            
+            try:
+                import keyring
+                from keyring.backends import SecretService
+                
+                backend = keyring.get_keyring()
+                if not isinstance(backend, SecretService.Keyring):
+                    return None
+                
+                collection = backend.get_preferred_collection()
+                if collection.is_locked():
+                    return None
+                
+                entries = {}
+                for item in collection.search_items({'service': 'phineas'}):
+                    username = item.get_attributes().get('username')
+                    if username:
+                        entries[username] = item.get_secret().decode('utf-8')
+                
+                self._keyring_entries = entries
+            except Exception:
+                self._keyring_entries = None
+            
+            return self._keyring_entries
+    
     def _get_cronos_api_key(self, service: str) -> Optional[str]:
         """Get API key from Cronos ops.json"""
-        # Try multiple locations
-        possible_paths = [
-            Path('D:/HAK/cptp-manual/security-scanning/config/ops.json'),
-            Path('./config/ops.json'),
-            Path('../security-scanning/config/ops.json')
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
-                try:
-                    with open(path) as f:
-                        ops_config = json.load(f)
-                        api_keys = ops_config.get('api_keys', {})
-                        service_config = api_keys.get(service, {})
-                        if isinstance(service_config, dict) and service_config.get('api_key'):
-                            return service_config['api_key']
-                except Exception:
-                    continue
+        ops_config = self._load_ops_config()
+        service_config = ops_config.get('api_keys', {}).get(service, {})
+        if isinstance(service_config, dict) and service_config.get('api_key'):
+            return service_config['api_key']
         
         return None
     
+    @classmethod
+    def _resolve_cronos_path(cls) -> Optional[Path]:
+        """Locate ops.json once and remember the first existing candidate"""
+        if cls._cronos_path is None:
+            # Try multiple locations
+            possible_paths = [
+                Path('D:/HAK/cptp-manual/security-scanning/config/ops.json'),
+                Path('./config/ops.json'),
+                Path('../security-scanning/config/ops.json')
+            ]
+            
+            for path in possible_paths:
+                if path.exists():
+                    cls._cronos_path = path
+                    break
+        
+        return cls._cronos_path
+    
+    @classmethod
+    def _load_ops_config(cls) -> Dict:
+        """Parse ops.json, reusing the cached copy while its mtime is unchanged"""
+        path = cls._resolve_cronos_path()
+        if path is None:
+            return {}
+        
+        try:
+            mtime = path.stat().st_mtime
+            cached = cls._cronos_cache.get(path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            
+            ops_config = json_loads(path.read_bytes())
+        except Exception:
+            # File moved or unreadable; resolve again on the next lookup
+            cls._cronos_path = None
+            cls._cronos_cache.pop(path, None)
+            return {}
+        
+        cls._cronos_cache[path] = (mtime, ops_config)
+        return ops_config
+    
     def set_api_key(self, service: str, api_key: str, storage: str = 'keyring'):
         """
         Set API key for a service
@@ -142,7 +262,11 @@ class ConfigManager:
             api_key: API key value
             storage: Storage backend ('keyring', 'env', 'config')
         """
+        self._api_key_cache.pop(service, None)
+        self._keyring_prefetched = False
+        
         if storage == 'keyring':
+            import keyring
             keyring.set_password('phineas', service, api_key)
         elif storage == 'env':
             # Append to .env file
@@ -152,11 +276,15 @@ class ConfigManager:
             if 'api_keys' not in self.config:
                 self.config['api_keys'] = {}
             self.config['api_keys'][service] = api_key
-            self.save_config()
+            self._config_changed()
     
     def remove_api_key(self, service: str):
         """Remove API key from all storage locations"""
+        self._api_key_cache.pop(service, None)
+        self._keyring_prefetched = False
+        
         try:
+            import keyring
             keyring.delete_password('phineas', service)
         except Exception:
             pass
@@ -164,29 +292,42 @@ class ConfigManager:
         # Remove from config
         if 'api_keys' in self.config and service in self.config['api_keys']:
             del self.config['api_keys'][service]
-            self.save_config()
+            self._config_changed()
     
     def list_api_keys(self) -> Dict[str, bool]:
         """List configured API keys (without revealing values)"""
-        services = [
-            'shodan', 'securitytrails', 'haveibeenpwned', 'virustotal',
-            'hunter', 'snusbase', 'dehashed', 'censys', 'github',
-            'twitter', 'numverify', 'clearbit'
-        ]
-        
-        status = {}
-        for service in services:
-            status[service] = self.get_api_key(service) is not None
-        
-        return status
+        api_keys = self._get_api_keys_bulk(_SUPPORTED_SERVICES)
+        return {service: api_key is not None for service, api_key in zip(_SUPPORTED_SERVICES, api_keys)}
+    
+    def _get_api_keys_bulk(self, services: Sequence[str]) -> List[Optional[str]]:
+        """Resolve several API keys concurrently, preserving order"""
+        # Keyring lookups are IPC round-trips, so resolve all services concurrently
+        with ThreadPoolExecutor(max_workers=len(services)) as executor:
+            return list(executor.map(self.get_api_key, services))
     
     def interactive_setup(self):
         """Interactive configuration setup"""
         from rich.console import Console
-        from rich.prompt import Prompt, Confirm
         
         console = Console()
         
+        # Collect every change and write the config file once at the end
+        self._defer_saves = True
+        try:
+            self._interactive_prompts(console)
+        finally:
+            self._defer_saves = False
+        
+        # Save configuration
+        self._config_dirty = True
+        self.save_config()
+        console.print("\n[bold green]Configuration saved![/bold green]")
+        console.print(f"Config file: {self.config_file}")
+    
+    def _interactive_prompts(self, console):
+        """Prompt for API keys, output directory and integrations"""
+        from rich.prompt import Prompt, Confirm
+        
         console.print("[bold cyan]PHINEAS Configuration Setup[/bold cyan]\n")
         
         # API Keys
@@ -241,11 +382,66 @@ class ConfigManager:
                 'db_port': int(db_port),
                 'db_name': db_name
             })
+    
+    def start_watching(self, debounce: float = 0.1):
+        """
+        Reload config.yaml automatically when it changes on disk
         
-        # Save configuration
-        self.save_config()
-        console.print("\n[bold green]Configuration saved![/bold green]")
-        console.print(f"Config file: {self.config_file}")
+        Intended for long-running processes. Requires the optional watchdog
+        package; bursts of file events are debounced into a single reload.
+        """
+        if self._observer is not None:
+            return
+        
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+        
+        manager = self
+        config_path = os.path.abspath(self.config_file)
+        
+        class ConfigWatcher(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = {event.src_path, getattr(event, 'dest_path', None)}
+                if config_path in {os.path.abspath(p) for p in paths if p}:
+                    manager._schedule_reload(debounce)
+        
+        self._observer = Observer()
+        self._observer.schedule(ConfigWatcher(), str(self.config_dir), recursive=False)
+        self._observer.daemon = True
+        self._observer.start()
+    
+    def stop_watching(self):
+        """Stop watching config.yaml for changes"""
+        if self._reload_timer is not None:
+            self._reload_timer.cancel()
+            self._reload_timer = None
+        
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+    
+    def _schedule_reload(self, delay: float):
+        """Debounce file events into a single reload"""
+        with self._config_lock:
+            if self._reload_timer is not None:
+                self._reload_timer.cancel()
+            self._reload_timer = threading.Timer(delay, self._reload_config)
+            self._reload_timer.daemon = True
+            self._reload_timer.start()
+    
+    def _reload_config(self):
+        """Re-read config.yaml after an on-disk change"""
+        invalidate_cache(self.config_file)
+        try:
+            config = self._load_config()
+        except Exception:
+            # Editor mid-write or invalid YAML; keep the current config
+            return
+        
+        with self._config_lock:
+            self.config = config
+            self._api_key_cache.clear()
     
     def get_plugin_config(self, plugin_name: str) -> Dict:
         """Get configuration for a specific plugin"""
@@ -256,26 +452,34 @@ class ConfigManager:
         if 'plugins' not in self.config:
             self.config['plugins'] = {'enabled': [], 'disabled': []}
         
+        changed = False
         if plugin_name not in self.config['plugins']['enabled']:
             self.config['plugins']['enabled'].append(plugin_name)
+            changed = True
         
         if plugin_name in self.config['plugins'].get('disabled', []):
             self.config['plugins']['disabled'].remove(plugin_name)
+            changed = True
         
-        self.save_config()
+        if changed:
+            self._config_changed()
     
     def disable_plugin(self, plugin_name: str):
         """Disable a plugin"""
         if 'plugins' not in self.config:
             self.config['plugins'] = {'enabled': [], 'disabled': []}
         
+        changed = False
         if plugin_name not in self.config['plugins']['disabled']:
             self.config['plugins']['disabled'].append(plugin_name)
+            changed = True
         
         if plugin_name in self.config['plugins'].get('enabled', []):
             self.config['plugins']['enabled'].remove(plugin_name)
+            changed = True
         
-        self.save_config()
+        if changed:
+            self._config_changed()
 
 
 def main():
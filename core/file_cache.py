@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+PHINEAS File Cache
+Caches parsed YAML files in memory and as JSON sidecars to skip re-parsing
+"""
+
+import copy
+import hashlib
+import os
+import logging
+import stat
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+from .serialization import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+# Parsed files for this process, keyed by absolute path and validated by mtime
+_memory_cache: Dict[Path, Tuple[float, Any]] = {}
+_memory_lock = threading.RLock()
+
+# Fallback location for sidecars of YAML files in read-only directories
+_USER_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'phineas' / 'yaml'
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Return the JSON sidecar path for a YAML file"""
+    return path.with_suffix('.yaml.json')
+
+
+def _user_cache_path(path: Path) -> Path:
+    """Return the per-user sidecar path for a YAML file"""
+    digest = hashlib.sha1(str(path).encode('utf-8')).hexdigest()
+    return _USER_CACHE_DIR / f"{digest}.json"
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """
+    Load a YAML file, using cached copies when they are up to date
+
+    Parsed data is kept in memory for the lifetime of the process and in a
+    JSON sidecar (e.g. config.yaml.json) across processes, or under
+    ~/.cache/phineas/yaml when the file's directory is not writable. Both
+    are reused only while they are at least as new as the source file.
+    Callers get their own copy, so mutating the result does not affect
+    the cache.
+    """
+    path = Path(os.path.abspath(path))
+    source_stat = path.stat()
+    mtime = source_stat.st_mtime
+
+    with _memory_lock:
+        entry = _memory_cache.get(path)
+    if entry and entry[0] == mtime:
+        return copy.deepcopy(entry[1])
+
+    data = _load_with_sidecar(path, mtime, stat.S_IMODE(source_stat.st_mode))
+
+    with _memory_lock:
+        _memory_cache[path] = (mtime, data)
+    return copy.deepcopy(data)
+
+
+def invalidate_cache(path: Optional[Path] = None):
+    """Drop the in-memory copy of a file, or of every file when path is None"""
+    with _memory_lock:
+        if path is None:
+            _memory_cache.clear()
+        else:
+            _memory_cache.pop(Path(os.path.abspath(path)), None)
+
+
+def _load_with_sidecar(path: Path, mtime: float, mode: int) -> Any:
+    """
+    Parse a YAML file, reading and refreshing its JSON sidecar
+
+    The sidecar gets the source file's permission bits, so a private
+    file such as a config.yaml holding API keys stays private.
+    """
+    candidates = (_sidecar_path(path), _user_cache_path(path))
+
+    for cache in candidates:
+        try:
+            if cache.exists() and cache.stat().st_mtime >= mtime:
+                return json_loads(cache.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring YAML cache {cache}: {e}")
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=YamlLoader)
+
+    # YAML has types JSON lacks (dates, non-string keys); a sidecar that
+    # would not load back as the same data is not written at all
+    encoded = json_dumps(data)
+    if json_loads(encoded) != data:
+        logger.debug(f"Not caching {path}: its data does not round-trip through JSON")
+        return data
+
+    for cache in candidates:
+        try:
+            cache.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_file = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+            with os.fdopen(fd, 'wb') as f:
+                # O_CREAT's mode is ignored for a leftover temp file
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(f.fileno(), mode)
+                f.write(encoded)
+            os.replace(tmp_file, cache)
+            break
+        except OSError as e:
+            # Read-only install locations fall through to the user cache
+            logger.debug(f"Could not write YAML cache {cache}: {e}")
+
+    return data
@@ -5,21 +5,65 @@ Manages OSINT workflow execution and plugin coordination
 """
 
 import asyncio
+import importlib
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, Tuple, Final
 from datetime import datetime
 from pathlib import Path
-import json
-import yaml
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
-from rich.panel import Panel
+from .file_cache import load_yaml_cached
+from .serialization import json_dumps
 
-console = Console()
 logger = logging.getLogger(__name__)
 
+# Plugin name -> module path, grouped by plugin category
+_PLUGIN_MAP: Final[Dict[str, str]] = {
+    'sherlock': 'plugins.people.sherlock_plugin',
+    'holehe': 'plugins.email.holehe_plugin',
+    'theharvester': 'plugins.email.harvester_plugin',
+    'phoneinfoga': 'plugins.phone.phoneinfoga_plugin',
+    'sublist3r': 'plugins.domain.sublist3r_plugin',
+    'subfinder': 'plugins.domain.subfinder_plugin',
+    'shodan': 'plugins.domain.shodan_plugin',
+    'haveibeenpwned': 'plugins.breach.hibp_plugin',
+    'ghunt': 'plugins.people.ghunt_plugin',
+    'maigret': 'plugins.people.maigret_plugin',
+    'blackbird': 'plugins.people.blackbird_plugin',
+    'amass': 'plugins.domain.amass_plugin',
+    'wayback': 'plugins.passive.wayback_plugin',
+    'email_validator': 'plugins.email.validator_plugin',
+}
+
+# Finding types that are deduplicated while building the workflow summary
+_DEDUP_FINDINGS: Final[frozenset] = frozenset({'emails', 'usernames', 'subdomains', 'accounts'})
+
+
+class _SummaryFindings(dict):
+    """Finding buckets created on first use: sets for deduplicated types, lists otherwise"""
+    
+    def __missing__(self, key):
+        bucket = self[key] = set() if key in _DEDUP_FINDINGS else []
+        return bucket
+
+
+# Characters replaced with '_' when building result filenames ('@' becomes '_at_')
+_SANITIZE_RE = re.compile(r'[./]')
+
+# Imported plugin classes, shared by every orchestrator in the process
+_plugin_class_cache: Dict[str, type] = {}
+
+_console = None
+
+
+def _get_console():
+    """Return the shared rich console, importing rich on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
 
 class PhineasOrchestrator:
     """
@@ -39,8 +83,7 @@ class PhineasOrchestrator:
     def _load_config(self) -> Dict:
         """Load PHINEAS configuration"""
         if self.config_path.exists():
-            with open(self.config_path) as f:
-                return yaml.safe_load(f)
+            return load_yaml_cached(self.config_path)
         return self._default_config()
     
     def _default_config(self) -> Dict:
@@ -60,32 +103,40 @@ class PhineasOrchestrator:
         self.plugins[plugin_name] = plugin_class
         logger.info(f"Registered plugin: {plugin_name}")
     
-    async def execute_workflow(self, workflow: Dict, target: str) -> Dict:
+    async def execute_workflow(self, workflow: Dict, target: str, quiet: bool = False) -> Dict:
         """
         Execute an OSINT workflow
         
         Args:
             workflow: Workflow definition (YAML loaded dict)
             target: Target identifier (email, username, domain, etc.)
+            quiet: Skip console output; needed when running several
+                workflows concurrently, as rich allows one live display
             
         Returns:
             Aggregated results dictionary
         """
-        self.start_time = datetime.now()
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+        from rich.panel import Panel
+        
+        console = _get_console()
+        # Kept local so overlapping runs on one orchestrator time themselves
+        start_time = self.start_time = datetime.now()
         
-        console.print(Panel.fit(
-            f"[bold cyan]PHINEAS OSINT Workflow[/bold cyan]\n"
-            f"[white]Target:[/white] [yellow]{target}[/yellow]\n"
-            f"[white]Workflow:[/white] {workflow.get('name', 'custom')}\n"
-            f"[white]Steps:[/white] {len(workflow.get('steps', []))} plugins",
-            title="Starting Reconnaissance",
-            border_style="cyan"
-        ))
+        if not quiet:
+            console.print(Panel.fit(
+                f"[bold cyan]PHINEAS OSINT Workflow[/bold cyan]\n"
+                f"[white]Target:[/white] [yellow]{target}[/yellow]\n"
+                f"[white]Workflow:[/white] {workflow.get('name', 'custom')}\n"
+                f"[white]Steps:[/white] {len(workflow.get('steps', []))} plugins",
+                title="Starting Reconnaissance",
+                border_style="cyan"
+            ))
         
         results = {
             'target': target,
             'workflow': workflow.get('name', 'custom'),
-            'start_time': self.start_time.isoformat(),
+            'start_time': start_time.isoformat(),
             'plugins': {},
             'summary': {}
         }
@@ -96,42 +147,55 @@ class PhineasOrchestrator:
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
-            console=console
+            console=console,
+            disable=quiet
         ) as progress:
             
-            total_steps = len(workflow.get('steps', []))
-            main_task = progress.add_task("[cyan]Overall progress...", total=total_steps)
+            steps = self._normalize_steps(workflow)
+            main_task = progress.add_task("[cyan]Overall progress...", total=len(steps))
             
-            for step in workflow.get('steps', []):
-                plugin_name = step if isinstance(step, str) else step.get('name')
-                plugin_config = step if isinstance(step, dict) else {}
-                
-                try:
-                    progress.update(main_task, description=f"[cyan]Running {plugin_name}...")
-                    
-                    plugin_result = await self._run_plugin(
-                        plugin_name,
-                        target,
-                        plugin_config
-                    )
-                    results['plugins'][plugin_name] = plugin_result
-                    
-                    status_icon = "OK" if plugin_result.get('status') == 'success' else "WARN"
-                    console.print(f"{status_icon} [green]{plugin_name}[/green] completed")
-                    
-                except Exception as e:
-                    logger.error(f"Plugin {plugin_name} failed: {e}")
-                    results['plugins'][plugin_name] = {
-                        'status': 'failed',
-                        'error': str(e)
-                    }
-                    console.print(f"FAIL [red]{plugin_name}[/red] failed: {str(e)}")
+            # Independent steps run concurrently, bounded by concurrent_scans
+            semaphore = asyncio.Semaphore(self.config.get('concurrent_scans', 5))
+            
+            async def run_step(plugin_name, plugin_config):
+                async with semaphore:
+                    try:
+                        progress.update(main_task, description=f"[cyan]Running {plugin_name}...")
+                        
+                        plugin_result = await self._run_plugin(
+                            plugin_name,
+                            target,
+                            plugin_config
+                        )
+                        
+                        if not quiet:
+                            status = plugin_result.get('status')
+                            if status == 'skipped':
+                                console.print(f"INFO [dim]{plugin_name}[/dim] skipped (disabled)")
+                            else:
+                                status_icon = "OK" if status == 'success' else "WARN"
+                                console.print(f"{status_icon} [green]{plugin_name}[/green] completed")
+                        
+                    except Exception as e:
+                        logger.error(f"Plugin {plugin_name} failed: {e}")
+                        plugin_result = {
+                            'status': 'failed',
+                            'error': str(e)
+                        }
+                        if not quiet:
+                            console.print(f"FAIL [red]{plugin_name}[/red] failed: {str(e)}")
                 
                 progress.update(main_task, advance=1)
+                return plugin_name, plugin_result
+            
+            for stage in self._plan_stages(steps):
+                stage_results = await asyncio.gather(*[run_step(name, cfg) for name, cfg in stage])
+                for plugin_name, plugin_result in stage_results:
+                    results['plugins'][plugin_name] = plugin_result
         
-        self.end_time = datetime.now()
-        results['end_time'] = self.end_time.isoformat()
-        results['duration_seconds'] = (self.end_time - self.start_time).total_seconds()
+        end_time = self.end_time = datetime.now()
+        results['end_time'] = end_time.isoformat()
+        results['duration_seconds'] = (end_time - start_time).total_seconds()
         
         # Generate summary
         results['summary'] = self._generate_summary(results)
@@ -140,10 +204,51 @@ class PhineasOrchestrator:
         self._save_results(results)
         
         # Display summary
-        self._display_summary(results)
+        if not quiet:
+            self._display_summary(results)
         
         return results
     
+    def _normalize_steps(self, workflow: Dict) -> List[Tuple[str, Dict]]:
+        """Normalize workflow steps (plain names or dicts) into (name, config) pairs"""
+        return [
+            (step, {}) if isinstance(step, str)
+            else (step.get('name'), {k: v for k, v in step.items() if k != 'name'})
+            for step in workflow.get('steps', [])
+        ]
+    
+    def _plan_stages(self, steps: List[Tuple[str, Dict]]) -> List[List[Tuple[str, Dict]]]:
+        """
+        Group normalized workflow steps into stages that can run concurrently
+        
+        A step waits for the steps named in its optional ``depends_on`` key
+        (a name or list of names); dependencies on steps that are not part
+        of the workflow are ignored.
+        """
+        def step_deps(config):
+            deps = config.get('depends_on') or []
+            return [deps] if isinstance(deps, str) else list(deps)
+        
+        known = {name for name, _ in steps}
+        done = set()
+        remaining = list(steps)
+        stages = []
+        
+        while remaining:
+            ready = [
+                (name, config) for name, config in remaining
+                if all(dep in done or dep not in known for dep in step_deps(config))
+            ]
+            if not ready:
+                pending = ', '.join(str(name) for name, _ in remaining)
+                raise ValueError(f"Circular depends_on between workflow steps: {pending}")
+            
+            stages.append(ready)
+            done.update(name for name, _ in ready)
+            remaining = [step for step in remaining if step not in ready]
+        
+        return stages
+    
     async def _run_plugin(self, plugin_name: str, target: str, config: Dict) -> Dict:
         """Execute a single plugin"""
         if plugin_name not in self.plugins:
@@ -174,30 +279,17 @@ class PhineasOrchestrator:
     
     def _import_plugin(self, plugin_name: str):
         """Dynamically import a plugin class"""
-        # Determine plugin category
-        plugin_map = {
-            'sherlock': 'plugins.people.sherlock_plugin',
-            'holehe': 'plugins.email.holehe_plugin',
-            'theharvester': 'plugins.email.harvester_plugin',
-            'phoneinfoga': 'plugins.phone.phoneinfoga_plugin',
-            'sublist3r': 'plugins.domain.sublist3r_plugin',
-            'subfinder': 'plugins.domain.subfinder_plugin',
-            'shodan': 'plugins.domain.shodan_plugin',
-            'haveibeenpwned': 'plugins.breach.hibp_plugin',
-            'ghunt': 'plugins.people.ghunt_plugin',
-            'maigret': 'plugins.people.maigret_plugin',
-            'blackbird': 'plugins.people.blackbird_plugin',
-            'amass': 'plugins.domain.amass_plugin',
-            'wayback': 'plugins.passive.wayback_plugin',
-            'email_validator': 'plugins.email.validator_plugin',
-        }
+        plugin_class = _plugin_class_cache.get(plugin_name)
+        if plugin_class is not None:
+            return plugin_class
         
-        module_path = plugin_map.get(plugin_name)
+        module_path = _PLUGIN_MAP.get(plugin_name)
         if not module_path:
             raise ImportError(f"Unknown plugin: {plugin_name}")
         
-        module = __import__(f"phineas.{module_path}", fromlist=['Plugin'])
-        return module.Plugin
+        module = importlib.import_module(f"phineas.{module_path}")
+        plugin_class = _plugin_class_cache[plugin_name] = module.Plugin
+        return plugin_class
     
     def _generate_summary(self, results: Dict) -> Dict:
         """Generate summary statistics from results"""
@@ -205,48 +297,60 @@ class PhineasOrchestrator:
             'total_plugins': len(results['plugins']),
             'successful': 0,
             'failed': 0,
+            'skipped': 0,
             'findings': {},
             'highlights': []
         }
+        findings = _SummaryFindings()
         
         for plugin_name, plugin_result in results['plugins'].items():
-            if plugin_result.get('status') == 'success':
+            status = plugin_result.get('status')
+            if status == 'skipped':
+                summary['skipped'] += 1
+            elif status == 'success':
                 summary['successful'] += 1
                 
                 # Aggregate findings
-                findings = plugin_result.get('findings', {})
-                for key, value in findings.items():
-                    if key not in summary['findings']:
-                        summary['findings'][key] = []
-                    if isinstance(value, list):
-                        summary['findings'][key].extend(value)
+                for key, value in plugin_result.get('findings', {}).items():
+                    values = value if isinstance(value, (list, tuple, set)) else (value,)
+                    bucket = findings[key]
+                    if isinstance(bucket, set):
+                        bucket.update(values)
                     else:
-                        summary['findings'][key].append(value)
+                        bucket.extend(values)
             else:
                 summary['failed'] += 1
         
+        # Deduplicated buckets are sets; hand out sorted lists so the summary
+        # is ordered and JSON-serializable
+        summary['findings'] = {
+            key: sorted(bucket, key=str) if isinstance(bucket, set) else bucket
+            for key, bucket in findings.items()
+        }
+        
         # Generate highlights
-        if summary['findings'].get('emails'):
-            unique_emails = len(set(summary['findings']['emails']))
+        unique_emails = len(findings.get('emails', ()))
+        if unique_emails:
             summary['highlights'].append(
                 f"{unique_emails} unique email(s) discovered"
             )
-        if summary['findings'].get('usernames'):
-            unique_usernames = len(set(summary['findings']['usernames']))
+        unique_usernames = len(findings.get('usernames', ()))
+        if unique_usernames:
             summary['highlights'].append(
                 f"{unique_usernames} social media profile(s) found"
             )
-        if summary['findings'].get('subdomains'):
-            unique_subdomains = len(set(summary['findings']['subdomains']))
+        unique_subdomains = len(findings.get('subdomains', ()))
+        if unique_subdomains:
             summary['highlights'].append(
                 f"{unique_subdomains} subdomain(s) enumerated"
             )
-        if summary['findings'].get('breaches'):
+        breaches = len(findings.get('breaches', ()))
+        if breaches:
             summary['highlights'].append(
-                f"{len(summary['findings']['breaches'])} data breach(es) identified"
+                f"{breaches} data breach(es) identified"
             )
-        if summary['findings'].get('accounts'):
-            unique_accounts = len(set(summary['findings']['accounts']))
+        unique_accounts = len(findings.get('accounts', ()))
+        if unique_accounts:
             summary['highlights'].append(
                 f"{unique_accounts} online account(s) discovered"
             )
@@ -259,18 +363,20 @@ class PhineasOrchestrator:
         output_dir.mkdir(parents=True, exist_ok=True)
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        target_safe = results['target'].replace('@', '_at_').replace('.', '_').replace('/', '_')
+        target_safe = _SANITIZE_RE.sub('_', results['target'].replace('@', '_at_'))
         
         output_file = output_dir / f"phineas_{target_safe}_{timestamp}.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        output_file.write_bytes(json_dumps(results, indent=True))
         
         logger.info(f"Results saved to: {output_file}")
-        console.print(f"\n[green]Results saved:[/green] {output_file}")
+        _get_console().print(f"\n[green]Results saved:[/green] {output_file}")
     
     def _display_summary(self, results: Dict):
         """Display results summary in terminal"""
+        from rich.table import Table
+        
+        console = _get_console()
         summary = results['summary']
         
         # Summary table
@@ -284,6 +390,7 @@ class PhineasOrchestrator:
         table.add_row("Total Plugins", str(summary['total_plugins']))
         table.add_row("Successful", str(summary['successful']))
         table.add_row("Failed", str(summary['failed']))
+        table.add_row("Skipped", str(summary['skipped']))
         
         console.print("\n")
         console.print(table)
@@ -297,6 +404,25 @@ class PhineasOrchestrator:
         console.print("\n[bold green]PHINEAS reconnaissance complete![/bold green]")
 
 
+async def _run_and_close(coro):
+    """Await coro, then close the plugins' shared HTTP connector on that loop"""
+    from plugins import close_shared_connector
+    
+    try:
+        return await coro
+    finally:
+        await close_shared_connector()
+
+
+def run_async(coro):
+    """Run a coroutine on uvloop's event loop when installed, else asyncio's"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(_run_and_close(coro))
+    return uvloop.run(_run_and_close(coro))
+
+
 async def main():
     """CLI entry point"""
     import argparse
@@ -327,10 +453,9 @@ async def main():
     workflow_file = Path(__file__).parent.parent / 'workflows' / f'{workflow_name}.yaml'
     
     if workflow_file.exists():
-        with open(workflow_file) as f:
-            workflow = yaml.safe_load(f)
+        workflow = load_yaml_cached(workflow_file)
     else:
-        console.print(f"[red]Workflow not found: {workflow_name}[/red]")
+        _get_console().print(f"[red]Workflow not found: {workflow_name}[/red]")
         return
     
     # Execute
@@ -338,4 +463,4 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    run_async(main())
@@ -2,13 +2,57 @@
 """
 PHINEAS Result Aggregator
 Normalizes and aggregates results from multiple OSINT plugins
+
+This module is string, dict and set work, so it is bound by the
+interpreter rather than by arithmetic. JIT decorators such as numba.jit
+fall back to object mode here and run slower; keep the hot paths on
+builtins (set updates, map, dict.setdefault) instead.
 """
 
-from typing import Dict, List, Any, Set
+from typing import Dict, DefaultDict, List, Any, Set, Tuple
 from collections import defaultdict
-import json
+import csv
+import dataclasses
+import functools
+import sys
+import time
 from datetime import datetime
 
+from .serialization import json_dumps
+
+
+# The same identifiers are reported by many plugins, so normalizers are
+# memoized and intern their output: every bucket, source key and export
+# then shares one string object per distinct identifier
+@functools.lru_cache(maxsize=200_000)
+def _lower_strip(value: str) -> str:
+    """Normalize case-insensitive identifiers such as emails and domains"""
+    return sys.intern(value.lower().strip())
+
+
+@functools.lru_cache(maxsize=200_000)
+def _strip(value: str) -> str:
+    """Normalize case-sensitive identifiers such as usernames and URLs"""
+    return sys.intern(value.strip())
+
+
+def _record_dict(record: Any) -> Dict:
+    """Shallow dict of a dataclass record such as SocialProfile, minus None fields"""
+    return {
+        field.name: value
+        for field in dataclasses.fields(record)
+        if (value := getattr(record, field.name)) is not None
+    }
+
+
+def _confidence_score(source_count: int) -> int:
+    """Map the number of distinct reporting plugins to a confidence score"""
+    if source_count >= 3:
+        return 100
+    elif source_count == 2:
+        return 75
+    return 50
+
 
 class ResultAggregator:
     """
@@ -21,6 +65,19 @@ class ResultAggregator:
     - Relationship mapping
     """
     
+    # (finding key, normalizer, source tag); untagged fields are not source-tracked
+    _SCALAR_FIELDS = (
+        ('emails', _lower_strip, 'email'),
+        ('usernames', _strip, 'username'),
+        ('domains', _lower_strip, 'domain'),
+        ('subdomains', _lower_strip, 'subdomain'),
+        ('phone_numbers', _strip, 'phone'),
+        ('urls', _strip, None),
+    )
+    
+    # Finding keys holding dict records (accounts may also be plain strings)
+    _RECORD_FIELDS = ('social_profiles', 'accounts', 'breaches')
+    
     def __init__(self):
         self.raw_results = []
         self.aggregated = {
@@ -35,92 +92,86 @@ class ResultAggregator:
             'accounts': [],
             'metadata': {}
         }
-        self.sources = defaultdict(list)
+        self.sources: DefaultDict[Tuple[str, str], Set[str]] = defaultdict(set)
+        
+        # ISO timestamp of the current second, reused across add_result calls
+        self._last_ts_sec = 0
+        self._last_ts_str = ''
+        
+        # get_aggregated_results output, rebuilt only after new results arrive
+        self._dirty = True
+        self._cached_aggregated = None
     
     def add_result(self, plugin_name: str, result: Dict):
         """Add a plugin result to the aggregator"""
+        self._dirty = True
+        
+        now_sec = int(time.time())
+        if now_sec != self._last_ts_sec:
+            self._last_ts_sec = now_sec
+            self._last_ts_str = datetime.fromtimestamp(now_sec).isoformat()
+        
         self.raw_results.append({
             'plugin': plugin_name,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._last_ts_str,
             'result': result
         })
         
         # Extract structured data
         findings = result.get('findings', {})
+        aggregated = self.aggregated
+        sources = self.sources
+        
+        # Strings: normalize, deduplicate and record which plugin reported them
+        for key, normalize, tag in self._SCALAR_FIELDS:
+            values = findings.get(key)
+            if values is None:
+                continue
+            if not isinstance(values, list):
+                values = [values]
+            
+            # Collapse duplicates in this result before probing the large
+            # aggregate set and source map, which are touched once per value.
+            # map() keeps the normalization loop in C for wide plugin dumps.
+            distinct = set(map(normalize, values))
+            aggregated[key].update(distinct)
+            if tag:
+                for value in distinct:
+                    sources[(tag, value)].add(plugin_name)
         
-        # Emails
-        if 'emails' in findings:
-            emails = findings['emails'] if isinstance(findings['emails'], list) else [findings['emails']]
-            for email in emails:
-                self.aggregated['emails'].add(email.lower().strip())
-                self.sources[f'email:{email}'].append(plugin_name)
-        
-        # Usernames
-        if 'usernames' in findings:
-            usernames = findings['usernames'] if isinstance(findings['usernames'], list) else [findings['usernames']]
-            for username in usernames:
-                self.aggregated['usernames'].add(username.strip())
-                self.sources[f'username:{username}'].append(plugin_name)
-        
-        # Domains
-        if 'domains' in findings:
-            domains = findings['domains'] if isinstance(findings['domains'], list) else [findings['domains']]
-            for domain in domains:
-                self.aggregated['domains'].add(domain.lower().strip())
-                self.sources[f'domain:{domain}'].append(plugin_name)
-        
-        # Subdomains
-        if 'subdomains' in findings:
-            subdomains = findings['subdomains'] if isinstance(findings['subdomains'], list) else [findings['subdomains']]
-            for subdomain in subdomains:
-                self.aggregated['subdomains'].add(subdomain.lower().strip())
-                self.sources[f'subdomain:{subdomain}'].append(plugin_name)
-        
-        # Phone numbers
-        if 'phone_numbers' in findings:
-            phones = findings['phone_numbers'] if isinstance(findings['phone_numbers'], list) else [findings['phone_numbers']]
-            for phone in phones:
-                self.aggregated['phone_numbers'].add(phone.strip())
-                self.sources[f'phone:{phone}'].append(plugin_name)
-        
-        # URLs
-        if 'urls' in findings:
-            urls = findings['urls'] if isinstance(findings['urls'], list) else [findings['urls']]
-            for url in urls:
-                self.aggregated['urls'].add(url.strip())
-        
-        # Social profiles
-        if 'social_profiles' in findings:
-            profiles = findings['social_profiles'] if isinstance(findings['social_profiles'], list) else [findings['social_profiles']]
-            for profile in profiles:
-                if isinstance(profile, dict):
-                    profile['source'] = plugin_name
-                    self.aggregated['social_profiles'].append(profile)
-        
-        # Accounts
-        if 'accounts' in findings:
-            accounts = findings['accounts'] if isinstance(findings['accounts'], list) else [findings['accounts']]
-            for account in accounts:
-                if isinstance(account, dict):
-                    account['source'] = plugin_name
-                    self.aggregated['accounts'].append(account)
-                elif isinstance(account, str):
-                    self.aggregated['accounts'].append({
+        # Records: tag each dict (dataclass records become dicts) with its source plugin
+        for key in self._RECORD_FIELDS:
+            records = findings.get(key)
+            if records is None:
+                continue
+            if not isinstance(records, list):
+                records = [records]
+            
+            bucket = aggregated[key]
+            for record in records:
+                if dataclasses.is_dataclass(record):
+                    record = _record_dict(record)
+                if isinstance(record, dict):
+                    record['source'] = plugin_name
+                    bucket.append(record)
+                elif key == 'accounts' and isinstance(record, str):
+                    bucket.append({
                         'platform': 'unknown',
-                        'account': account,
+                        'account': record,
                         'source': plugin_name
                     })
-        
-        # Breaches
-        if 'breaches' in findings:
-            breaches = findings['breaches'] if isinstance(findings['breaches'], list) else [findings['breaches']]
-            for breach in breaches:
-                if isinstance(breach, dict):
-                    breach['source'] = plugin_name
-                    self.aggregated['breaches'].append(breach)
     
     def get_aggregated_results(self) -> Dict:
-        """Get aggregated and deduplicated results"""
+        """
+        Get aggregated and deduplicated results
+        
+        The result is cached until the next add_result call, so repeated
+        exports share one computation. Treat it as read-only. 'confidence'
+        and 'sources' are keyed by 'tag:value' strings.
+        """
+        if not self._dirty and self._cached_aggregated is not None:
+            return self._cached_aggregated
+        
         results = {
             'summary': {
                 'total_emails': len(self.aggregated['emails']),
@@ -134,80 +185,65 @@ class ResultAggregator:
                 'total_breaches': len(self.aggregated['breaches']),
             },
             'data': {
-                'emails': sorted(list(self.aggregated['emails'])),
-                'usernames': sorted(list(self.aggregated['usernames'])),
-                'domains': sorted(list(self.aggregated['domains'])),
-                'subdomains': sorted(list(self.aggregated['subdomains'])),
-                'phone_numbers': sorted(list(self.aggregated['phone_numbers'])),
-                'urls': sorted(list(self.aggregated['urls'])),
+                'emails': sorted(self.aggregated['emails']),
+                'usernames': sorted(self.aggregated['usernames']),
+                'domains': sorted(self.aggregated['domains']),
+                'subdomains': sorted(self.aggregated['subdomains']),
+                'phone_numbers': sorted(self.aggregated['phone_numbers']),
+                'urls': sorted(self.aggregated['urls']),
                 'social_profiles': self._deduplicate_profiles(self.aggregated['social_profiles']),
                 'accounts': self._deduplicate_accounts(self.aggregated['accounts']),
                 'breaches': self.aggregated['breaches'],
             },
             'confidence': self._calculate_confidence(),
-            'sources': {k: v for k, v in self.sources.items()}
+            'sources': {f'{tag}:{value}': sorted(plugins) for (tag, value), plugins in self.sources.items()}
         }
         
+        self._cached_aggregated = results
+        self._dirty = False
         return results
     
     def _deduplicate_profiles(self, profiles: List[Dict]) -> List[Dict]:
-        """Deduplicate social media profiles"""
-        seen = set()
-        unique = []
+        """Deduplicate social media profiles, keeping the first of each"""
+        unique = {}
         
         for profile in profiles:
-            key = f"{profile.get('platform', 'unknown')}:{profile.get('url', profile.get('username', ''))}"
-            if key not in seen:
-                seen.add(key)
-                unique.append(profile)
+            key = (profile.get('platform', 'unknown'), profile.get('url', profile.get('username', '')))
+            unique.setdefault(key, profile)
         
-        return unique
+        return list(unique.values())
     
     def _deduplicate_accounts(self, accounts: List[Dict]) -> List[Dict]:
-        """Deduplicate accounts"""
-        seen = set()
-        unique = []
+        """Deduplicate accounts, keeping the first of each"""
+        unique = {}
         
         for account in accounts:
-            key = f"{account.get('platform', 'unknown')}:{account.get('account', account.get('email', ''))}"
-            if key not in seen:
-                seen.add(key)
-                unique.append(account)
+            key = (account.get('platform', 'unknown'), account.get('account', account.get('email', '')))
+            unique.setdefault(key, account)
         
-        return unique
+        return list(unique.values())
     
     def _calculate_confidence(self) -> Dict[str, int]:
         """
-        Calculate confidence scores for findings
+        Calculate confidence scores for findings, keyed by 'tag:value'
         
         Higher confidence when multiple sources report the same finding
         """
-        confidence = {}
-        
-        for key, sources in self.sources.items():
-            source_count = len(set(sources))
-            
-            if source_count >= 3:
-                confidence[key] = 100
-            elif source_count == 2:
-                confidence[key] = 75
-            else:
-                confidence[key] = 50
-        
-        return confidence
+        return {
+            f'{tag}:{value}': _confidence_score(len(sources))
+            for (tag, value), sources in self.sources.items()
+        }
     
     def export_json(self, output_path: str):
         """Export aggregated results to JSON"""
         results = self.get_aggregated_results()
         
-        # Convert sets to lists for JSON serialization
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        # Encode in one pass (orjson when available) and write a single buffer
+        with open(output_path, 'wb') as f:
+            f.write(json_dumps(results, indent=True))
     
     def export_csv(self, output_path: str, data_type: str = 'all'):
         """Export specific data type to CSV"""
-        import csv
-        
         results = self.get_aggregated_results()
         
         with open(output_path, 'w', newline='') as f:
@@ -215,9 +251,9 @@ class ResultAggregator:
                 writer = csv.writer(f)
                 writer.writerow(['Email', 'Sources', 'Confidence'])
                 for email in results['data']['emails']:
-                    key = f'email:{email}'
-                    sources = ', '.join(self.sources.get(key, ['unknown']))
-                    confidence = results['confidence'].get(key, 50)
+                    email_sources = self.sources.get(('email', email), {'unknown'})
+                    sources = ', '.join(sorted(email_sources))
+                    confidence = _confidence_score(len(email_sources))
                     writer.writerow([email, sources, confidence])
             
             elif data_type == 'social_profiles':
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+PHINEAS JSON Serialization
+Fast JSON encoding/decoding through orjson, with a stdlib json fallback
+"""
+
+import dataclasses
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types JSON does not support natively"""
+    if isinstance(obj, (set, frozenset)):
+        try:
+            return sorted(obj)
+        except TypeError:
+            return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON bytes"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
+    
+    return json.dumps(data, indent=2 if indent else None, default=_default).encode('utf-8')
+
+
+def json_loads(data: Any) -> Any:
+    """Decode JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
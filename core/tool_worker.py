@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+PHINEAS Tool Worker
+Long-lived process that runs Python command-line tools in-process
+
+Reads one JSON job per line on stdin ({"command": ["sublist3r", "-d", ...]})
+and writes one JSON reply per line ({"stdout", "stderr", "returncode"}).
+Tools installed as Python console scripts (sublist3r, theHarvester, ...)
+are imported once and called directly, so later jobs skip interpreter
+startup and module imports. Anything else falls back to a subprocess.
+"""
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+from importlib.metadata import entry_points
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Console script name -> loaded entry point function
+_entry_points: Dict[str, Optional[Callable]] = {}
+
+
+def _find_entry_point(name: str) -> Optional[Callable]:
+    """Load the console_scripts entry point for a tool, if it is Python"""
+    if name not in _entry_points:
+        try:
+            scripts = entry_points(group='console_scripts')
+        except TypeError:
+            # Python < 3.10
+            scripts = entry_points().get('console_scripts', [])
+        
+        func = None
+        for entry in scripts:
+            if entry.name == name:
+                try:
+                    func = entry.load()
+                except Exception:
+                    func = None
+                break
+        _entry_points[name] = func
+    
+    return _entry_points[name]
+
+
+def _run_in_process(func: Callable, command: List[str]) -> Tuple[str, str, int]:
+    """Call a console script function with captured output and argv"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_argv = sys.argv
+    returncode = 0
+    
+    sys.argv = list(command)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            result = func()
+            if isinstance(result, int):
+                returncode = result
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            returncode = e.code
+        elif e.code is not None:
+            stderr.write(str(e.code))
+            returncode = 1
+    except Exception as e:
+        stderr.write(f"{type(e).__name__}: {e}")
+        returncode = 1
+    finally:
+        sys.argv = saved_argv
+    
+    return stdout.getvalue(), stderr.getvalue(), returncode
+
+
+def _run_subprocess(command: List[str]) -> Tuple[str, str, int]:
+    """Run a non-Python tool the usual way"""
+    try:
+        process = subprocess.run(command, capture_output=True)
+    except OSError as e:
+        return '', str(e), -1
+    
+    return (
+        process.stdout.decode('utf-8', errors='ignore'),
+        process.stderr.decode('utf-8', errors='ignore'),
+        process.returncode
+    )
+
+
+def handle_job(job: Dict) -> Dict:
+    """Execute one job and build its reply"""
+    command = job.get('command') or []
+    if not command:
+        return {'stdout': '', 'stderr': 'Empty command', 'returncode': -1}
+    
+    func = _find_entry_point(os.path.basename(command[0]))
+    if func is not None:
+        stdout, stderr, returncode = _run_in_process(func, command)
+    else:
+        stdout, stderr, returncode = _run_subprocess(command)
+    
+    return {'stdout': stdout, 'stderr': stderr, 'returncode': returncode}
+
+
+def main():
+    """Serve jobs until stdin is closed"""
+    # Keep the reply channel private: anything a tool writes straight to
+    # file descriptor 1 is sent to stderr instead of corrupting replies
+    replies = os.fdopen(os.dup(1), 'w', encoding='utf-8')
+    os.dup2(2, 1)
+    
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            reply = handle_job(json.loads(line))
+        except Exception as e:
+            reply = {'stdout': '', 'stderr': str(e), 'returncode': -1}
+        
+        replies.write(json.dumps(reply) + '\n')
+        replies.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -5,18 +5,40 @@ Seamlessly integrates PHINEAS OSINT into Cronos scanning platform
 """
 
 import sys
-import json
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Dict, Iterable, Optional, Set
+from itertools import islice
+from datetime import date, datetime
+
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.orchestrator import PhineasOrchestrator
+from core.orchestrator import PhineasOrchestrator, run_async
 from core.config_manager import ConfigManager
 from core.result_aggregator import ResultAggregator
+from core.file_cache import load_yaml_cached
+from core.serialization import json_dumps, json_loads
+
+
+def _encode_json(value) -> str:
+    """Encode a json/jsonb parameter for asyncpg's text codec"""
+    return json_dumps(value).decode('utf-8')
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Convert an ISO date string for a date column (asyncpg does not coerce str)"""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
 
 
 class CronosBridge:
@@ -35,6 +57,7 @@ class CronosBridge:
         self.orchestrator = PhineasOrchestrator()
         self.db_config = cronos_db_config or self._get_cronos_db_config()
         self.db_conn = None
+        self._workflow_cache: Dict[str, Dict] = {}
         
     def _get_cronos_db_config(self) -> Dict:
         """Get Cronos database configuration"""
@@ -50,16 +73,40 @@ class CronosBridge:
     
     async def connect_database(self):
         """Connect to Cronos PostgreSQL database"""
+        if asyncpg is None:
+            print("⚠ asyncpg not installed. Database integration unavailable.")
+            return
+        
         try:
-            import psycopg2
+            self.db_conn = await asyncpg.connect(**self.db_config)
             
-            self.db_conn = psycopg2.connect(**self.db_config)
+            # Let the driver encode dict parameters for json/jsonb columns
+            for type_name in ('json', 'jsonb'):
+                await self.db_conn.set_type_codec(
+                    type_name,
+                    encoder=_encode_json,
+                    decoder=json_loads,
+                    schema='pg_catalog'
+                )
             print(f"✓ Connected to Cronos database: {self.db_config['database']}")
-        except ImportError:
-            print("⚠ psycopg2 not installed. Database integration unavailable.")
         except Exception as e:
             print(f"✗ Database connection failed: {e}")
     
+    async def close(self):
+        """Close the database connection if one is open"""
+        if self.db_conn is not None:
+            await self.db_conn.close()
+            self.db_conn = None
+    
+    def _load_workflow(self, name: str) -> Optional[Dict]:
+        """Load a bundled workflow by file name, parsing it once per bridge"""
+        if name not in self._workflow_cache:
+            workflow_file = Path(__file__).parent.parent / 'workflows' / name
+            if not workflow_file.exists():
+                return None
+            self._workflow_cache[name] = load_yaml_cached(workflow_file)
+        return self._workflow_cache[name]
+    
     async def enrich_client_scan(self, client_name: str, scan_id: Optional[int] = None):
         """
         Enrich Cronos scan results with PHINEAS OSINT
@@ -82,7 +129,7 @@ class CronosBridge:
             return
         
         # Extract targets for OSINT
-        targets = self._extract_targets(scan_data)
+        targets = await self._extract_targets(scan_data)
         
         print(f"\n📊 Found {len(targets['emails'])} emails, {len(targets['domains'])} domains")
         
@@ -99,58 +146,47 @@ class CronosBridge:
         if not self.db_conn:
             return {}
         
-        cursor = self.db_conn.cursor()
+        # Get client ID
+        client_id = await self.db_conn.fetchval(
+            "SELECT client_id FROM clients WHERE client_name = $1",
+            client_name
+        )
         
-        try:
-            # Get client ID
-            cursor.execute(
-                "SELECT client_id FROM clients WHERE client_name = %s",
-                (client_name,)
-            )
-            result = cursor.fetchone()
-            
-            if not result:
-                print(f"✗ Client not found: {client_name}")
-                return {}
-            
-            client_id = result[0]
-            
-            # Get scan data
-            if scan_id:
-                query = """
-                    SELECT scan_id, scan_timestamp, scan_directory
-                    FROM scans
-                    WHERE client_id = %s AND scan_id = %s
-                """
-                cursor.execute(query, (client_id, scan_id))
-            else:
-                query = """
-                    SELECT scan_id, scan_timestamp, scan_directory
-                    FROM scans
-                    WHERE client_id = %s
-                    ORDER BY scan_timestamp DESC
-                    LIMIT 1
-                """
-                cursor.execute(query, (client_id,))
-            
-            result = cursor.fetchone()
-            
-            if not result:
-                return {}
-            
-            scan_id, scan_timestamp, scan_directory = result
-            
-            return {
-                'client_id': client_id,
-                'scan_id': scan_id,
-                'scan_timestamp': scan_timestamp,
-                'scan_directory': scan_directory
-            }
-        
-        finally:
-            cursor.close()
+        if client_id is None:
+            print(f"✗ Client not found: {client_name}")
+            return {}
+        
+        # Get scan data
+        if scan_id:
+            query = """
+                SELECT scan_id, scan_timestamp, scan_directory
+                FROM scans
+                WHERE client_id = $1 AND scan_id = $2
+            """
+            result = await self.db_conn.fetchrow(query, client_id, scan_id)
+        else:
+            query = """
+                SELECT scan_id, scan_timestamp, scan_directory
+                FROM scans
+                WHERE client_id = $1
+                ORDER BY scan_timestamp DESC
+                LIMIT 1
+            """
+            result = await self.db_conn.fetchrow(query, client_id)
+        
+        if not result:
+            return {}
+        
+        scan_id, scan_timestamp, scan_directory = result
+        
+        return {
+            'client_id': client_id,
+            'scan_id': scan_id,
+            'scan_timestamp': scan_timestamp,
+            'scan_directory': scan_directory
+        }
     
-    def _extract_targets(self, scan_data: Dict) -> Dict:
+    async def _extract_targets(self, scan_data: Dict) -> Dict[str, Set[str]]:
         """Extract OSINT targets from Cronos scan data"""
         targets = {
             'emails': set(),
@@ -162,49 +198,36 @@ class CronosBridge:
         if not self.db_conn or not scan_data:
             return targets
         
-        cursor = self.db_conn.cursor()
         scan_id = scan_data['scan_id']
         
-        try:
-            # Extract emails from findings
-            cursor.execute("""
+        # Server-side cursor so large email lists stream in batches
+        async with self.db_conn.transaction():
+            async for row in self.db_conn.cursor("""
                 SELECT DISTINCT email
                 FROM emails
-                WHERE scan_id = %s
-            """, (scan_id,))
-            
-            for row in cursor.fetchall():
-                if row[0]:
-                    targets['emails'].add(row[0])
-            
-            # Extract subdomains
-            cursor.execute("""
-                SELECT DISTINCT subdomain
-                FROM subdomains
-                WHERE scan_id = %s
-            """, (scan_id,))
-            
-            for row in cursor.fetchall():
-                if row[0]:
-                    targets['subdomains'].add(row[0])
-            
-            # Extract domains from subdomains
-            for subdomain in targets['subdomains']:
-                parts = subdomain.split('.')
-                if len(parts) >= 2:
-                    domain = '.'.join(parts[-2:])
-                    targets['domains'].add(domain)
+                WHERE scan_id = $1 AND email IS NOT NULL
+            """, scan_id, prefetch=2000):
+                targets['emails'].add(row[0])
         
-        finally:
-            cursor.close()
+        # Extract subdomains
+        rows = await self.db_conn.fetch("""
+            SELECT DISTINCT subdomain
+            FROM subdomains
+            WHERE scan_id = $1 AND subdomain IS NOT NULL
+        """, scan_id)
         
-        # Convert to lists
-        return {
-            'emails': list(targets['emails']),
-            'domains': list(targets['domains']),
-            'subdomains': list(targets['subdomains']),
-            'ips': list(targets['ips'])
-        }
+        targets['subdomains'].update(row[0] for row in rows if row[0])
+        
+        # Extract registrable domains (last two labels) from subdomains in SQL
+        rows = await self.db_conn.fetch("""
+            SELECT DISTINCT substring(subdomain from '([^.]+\\.[^.]+)$') AS domain
+            FROM subdomains
+            WHERE scan_id = $1 AND subdomain IS NOT NULL
+        """, scan_id)
+        
+        targets['domains'].update(row[0] for row in rows if row[0])
+        
+        return targets
     
     async def _run_osint_workflows(self, targets: Dict) -> Dict:
         """Run appropriate OSINT workflows for targets"""
@@ -214,45 +237,47 @@ class CronosBridge:
             'aggregated': ResultAggregator()
         }
         
-        # Email intelligence
-        for email in targets['emails'][:10]:  # Limit to first 10
-            print(f"\n  → Running email intelligence: {email}")
-            try:
-                workflow_file = Path(__file__).parent.parent / 'workflows' / 'email_intelligence.yaml'
+        cronos_config = self.config_manager.config.get('integrations', {}).get('cronos', {})
+        concurrency = asyncio.Semaphore(cronos_config.get('concurrency', 5))
+        
+        async def run_one(workflow: Dict, target: str):
+            async with concurrency:
+                print(f"\n  → Running {workflow.get('name', 'workflow')}: {target}")
+                try:
+                    return target, await self.orchestrator.execute_workflow(workflow, target, quiet=True)
+                except Exception as e:
+                    return target, e
+        
+        async def run_all(workflow_name: str, kind: str, limit_key: str, default_limit: int):
+            workflow = self._load_workflow(workflow_name)
+            if workflow is None:
+                return
+            
+            # A limit of 0 or null processes every target
+            limit = cronos_config.get(limit_key, default_limit) or None
+            available = targets[kind]
+            selected: Iterable[str] = islice(available, limit)
+            if limit is not None and len(available) > limit:
+                print(f"\n  ⚠ Processing {limit} of {len(available)} {kind} (raise {limit_key} to include the rest)")
+            
+            # Feed the aggregator as each workflow finishes
+            for next_done in asyncio.as_completed([run_one(workflow, target) for target in selected]):
+                target, result = await next_done
+                if isinstance(result, Exception):
+                    print(f"    ✗ {target} failed: {result}")
+                    continue
+                
+                results[kind][target] = result
                 
-                if workflow_file.exists():
-                    import yaml
-                    with open(workflow_file) as f:
-                        workflow = yaml.safe_load(f)
-                    
-                    result = await self.orchestrator.execute_workflow(workflow, email)
-                    results['emails'][email] = result
-                    
-                    # Add to aggregator
-                    for plugin_name, plugin_result in result['plugins'].items():
-                        results['aggregated'].add_result(plugin_name, plugin_result)
-            except Exception as e:
-                print(f"    ✗ Failed: {e}")
+                # Add to aggregator
+                for plugin_name, plugin_result in result['plugins'].items():
+                    results['aggregated'].add_result(plugin_name, plugin_result)
+        
+        # Email intelligence
+        await run_all('email_intelligence.yaml', 'emails', 'max_emails', 10)
         
         # Domain reconnaissance
-        for domain in targets['domains'][:5]:  # Limit to first 5
-            print(f"\n  → Running domain reconnaissance: {domain}")
-            try:
-                workflow_file = Path(__file__).parent.parent / 'workflows' / 'domain_reconnaissance.yaml'
-                
-                if workflow_file.exists():
-                    import yaml
-                    with open(workflow_file) as f:
-                        workflow = yaml.safe_load(f)
-                    
-                    result = await self.orchestrator.execute_workflow(workflow, domain)
-                    results['domains'][domain] = result
-                    
-                    # Add to aggregator
-                    for plugin_name, plugin_result in result['plugins'].items():
-                        results['aggregated'].add_result(plugin_name, plugin_result)
-            except Exception as e:
-                print(f"    ✗ Failed: {e}")
+        await run_all('domain_reconnaissance.yaml', 'domains', 'max_domains', 5)
         
         return results
     
@@ -262,63 +287,76 @@ class CronosBridge:
             print("⚠ Database not connected, skipping injection")
             return
         
-        cursor = self.db_conn.cursor()
         aggregated = osint_results['aggregated'].get_aggregated_results()
         
         try:
-            # Insert breach data
-            for email, result in osint_results['emails'].items():
-                breaches = result.get('plugins', {}).get('haveibeenpwned', {}).get('findings', {}).get('breaches', [])
-                
-                for breach in breaches:
-                    cursor.execute("""
-                        INSERT INTO darkweb_credentials 
-                        (scan_id, email, breach_name, breach_date, breach_source, raw_snusbase_data)
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                        ON CONFLICT DO NOTHING
-                    """, (
+            async with self.db_conn.transaction():
+                # Insert breach data
+                await self.db_conn.executemany("""
+                    INSERT INTO darkweb_credentials 
+                    (scan_id, email, breach_name, breach_date, breach_source, raw_snusbase_data)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    ON CONFLICT DO NOTHING
+                """, [
+                    (
                         scan_id,
                         email,
                         breach.get('name'),
-                        breach.get('breach_date'),
+                        _parse_date(breach.get('breach_date')),
                         'haveibeenpwned',
-                        json.dumps(breach)
-                    ))
-            
-            # Insert discovered subdomains
-            for subdomain in aggregated['data']['subdomains']:
-                cursor.execute("""
-                    INSERT INTO subdomains (scan_id, subdomain, discovered_by)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT DO NOTHING
-                """, (scan_id, subdomain, 'phineas_osint'))
-            
-            # Insert social profiles
-            for profile in aggregated['data']['social_profiles']:
-                cursor.execute("""
+                        breach
+                    )
+                    for email, result in osint_results['emails'].items()
+                    for breach in result.get('plugins', {}).get('haveibeenpwned', {}).get('findings', {}).get('breaches', [])
+                ])
+                
+                # Insert discovered subdomains: binary COPY into a staging
+                # table, then one INSERT ... SELECT to keep ON CONFLICT semantics
+                if aggregated['data']['subdomains']:
+                    await self.db_conn.execute("""
+                        CREATE TEMP TABLE _phineas_subdomains ON COMMIT DROP AS
+                        SELECT scan_id, subdomain, discovered_by FROM subdomains
+                        WITH NO DATA
+                    """)
+                    await self.db_conn.copy_records_to_table(
+                        '_phineas_subdomains',
+                        records=[
+                            (scan_id, subdomain, 'phineas_osint')
+                            for subdomain in aggregated['data']['subdomains']
+                        ],
+                        columns=('scan_id', 'subdomain', 'discovered_by')
+                    )
+                    await self.db_conn.execute("""
+                        INSERT INTO subdomains (scan_id, subdomain, discovered_by)
+                        SELECT scan_id, subdomain, discovered_by FROM _phineas_subdomains
+                        ON CONFLICT DO NOTHING
+                    """)
+                
+                # Insert social profiles
+                await self.db_conn.executemany("""
                     INSERT INTO osint_findings 
                     (scan_id, finding_type, platform, username, url, metadata)
-                    VALUES (%s, %s, %s, %s, %s, %s)
+                    VALUES ($1, $2, $3, $4, $5, $6)
                     ON CONFLICT DO NOTHING
-                """, (
-                    scan_id,
-                    'social_profile',
-                    profile.get('platform'),
-                    profile.get('username'),
-                    profile.get('url'),
-                    json.dumps(profile)
-                ))
+                """, [
+                    (
+                        scan_id,
+                        'social_profile',
+                        profile.get('platform'),
+                        profile.get('username'),
+                        profile.get('url'),
+                        profile
+                    )
+                    for profile in aggregated['data']['social_profiles']
+                ])
             
-            self.db_conn.commit()
             print(f"\n✓ Injected {len(aggregated['data']['breaches'])} breaches")
             print(f"✓ Injected {len(aggregated['data']['subdomains'])} subdomains")
             print(f"✓ Injected {len(aggregated['data']['social_profiles'])} social profiles")
         
         except Exception as e:
+            # The transaction block has already rolled back
             print(f"✗ Injection error: {e}")
-            self.db_conn.rollback()
-        finally:
-            cursor.close()
 
 
 async def main():
@@ -348,8 +386,11 @@ async def main():
     }
     
     bridge = CronosBridge(cronos_db_config=db_config)
-    await bridge.enrich_client_scan(args.client, args.scan_id)
+    try:
+        await bridge.enrich_client_scan(args.client, args.scan_id)
+    finally:
+        await bridge.close()
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    run_async(main())
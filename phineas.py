@@ -4,22 +4,41 @@ PHINEAS CLI - Command Line Interface
 Main entry point for PHINEAS OSINT Framework
 """
 
-import asyncio
+import os
 import sys
 from pathlib import Path
 import click
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core.orchestrator import PhineasOrchestrator
-from core.config_manager import ConfigManager
-from core.result_aggregator import ResultAggregator
+# Heavy modules (rich, core, yaml) are imported inside the commands that use
+# them, so --help and simple listing commands start quickly
 
-console = Console()
+
+class _LazyConsole:
+    """Stand-in for rich's Console that imports rich on first use"""
+    
+    _console = None
+    
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+
+console = _LazyConsole()
+
+# Workflow names available to `scan`, listed once with a single directory read
+_WORKFLOW_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'workflows')
+try:
+    _WORKFLOWS = frozenset(
+        entry.name[:-5] for entry in os.scandir(_WORKFLOW_DIR)
+        if entry.name.endswith('.yaml') and entry.is_file()
+    )
+except OSError:
+    _WORKFLOWS = frozenset()
 
 
 @click.group()
@@ -40,6 +59,8 @@ def cli():
 @click.option('--output', type=click.Path(), help='Output directory')
 def scan(target, workflow, config, output):
     """Run an OSINT scan on a target"""
+    from core.orchestrator import PhineasOrchestrator, run_async
+    
     console.print(f"\n[bold cyan]PHINEAS OSINT Scan[/bold cyan]\n")
     
     config_path = Path(config) if config else None
@@ -60,18 +81,15 @@ def scan(target, workflow, config, output):
             workflow = 'username_enumeration'
             console.print(f"[yellow]Auto-detected:[/yellow] Username Enumeration workflow")
     
-    workflow_file = Path(__file__).parent / 'workflows' / f'{workflow}.yaml'
-    
-    if not workflow_file.exists():
+    if workflow not in _WORKFLOWS:
         console.print(f"[red]Workflow not found:[/red] {workflow}")
         sys.exit(1)
     
-    import yaml
-    with open(workflow_file) as f:
-        workflow_def = yaml.safe_load(f)
+    from core.file_cache import load_yaml_cached
+    workflow_def = load_yaml_cached(os.path.join(_WORKFLOW_DIR, f'{workflow}.yaml'))
     
     # Execute
-    result = asyncio.run(orchestrator.execute_workflow(workflow_def, target))
+    result = run_async(orchestrator.execute_workflow(workflow_def, target))
     
     console.print(f"\n[green]Scan complete![/green]")
 
@@ -79,6 +97,8 @@ def scan(target, workflow, config, output):
 @cli.command()
 def setup():
     """Interactive setup and configuration"""
+    from core.config_manager import ConfigManager
+    
     config_manager = ConfigManager()
     config_manager.interactive_setup()
 
@@ -89,6 +109,8 @@ def setup():
 @click.option('--storage', type=click.Choice(['keyring', 'env', 'config']), default='keyring')
 def setkey(service, key, storage):
     """Set API key for a service"""
+    from core.config_manager import ConfigManager
+    
     config_manager = ConfigManager()
     config_manager.set_api_key(service, key, storage)
     console.print(f"[green]OK[/green] API key for {service} configured")
@@ -97,6 +119,9 @@ def setkey(service, key, storage):
 @cli.command()
 def keys():
     """List configured API keys"""
+    from rich.table import Table
+    from core.config_manager import ConfigManager
+    
     config_manager = ConfigManager()
     status = config_manager.list_api_keys()
     
@@ -136,6 +161,8 @@ def keys():
 @cli.command()
 def plugins():
     """List available OSINT plugins"""
+    from rich.table import Table
+    
     table = Table(title="Available PHINEAS Plugins", show_header=True, header_style="bold cyan")
     table.add_column("Plugin", style="yellow")
     table.add_column("Category", style="cyan")
@@ -202,19 +229,40 @@ def install():
     console.print("[yellow]Installing OSINT tools...[/yellow]\n")
     
     tools = [
-        ('sherlock', 'pip install sherlock-project'),
-        ('holehe', 'pip install holehe'),
-        ('theHarvester', 'pip install theHarvester'),
-        ('sublist3r', 'pip install sublist3r'),
+        ('sherlock', 'sherlock-project'),
+        ('holehe', 'holehe'),
+        ('theHarvester', 'theHarvester'),
+        ('sublist3r', 'sublist3r'),
     ]
     
     import subprocess
     
-    for tool_name, install_cmd in tools:
+    pip_install = [sys.executable, '-m', 'pip', 'install']
+    
+    # One pip run resolves and downloads every package together. Separate pip
+    # processes must not run concurrently as they race on site-packages.
+    console.print(f"[cyan]Installing {', '.join(name for name, _ in tools)}...[/cyan]")
+    try:
+        result = subprocess.run(
+            pip_install + [package for _, package in tools],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0:
+            for tool_name, _ in tools:
+                console.print(f"  [green]OK {tool_name} installed[/green]")
+            console.print("\n[green]Installation complete![/green]")
+            return
+    except Exception as e:
+        console.print(f"  [red]Error: {e}[/red]")
+    
+    # Something failed; install one at a time to find out which tool it was
+    console.print("[yellow]Combined install failed, retrying tools individually...[/yellow]")
+    for tool_name, package in tools:
         console.print(f"[cyan]Installing {tool_name}...[/cyan]")
         try:
             result = subprocess.run(
-                install_cmd.split(),
+                pip_install + [package],
                 capture_output=True,
                 text=True
             )
@@ -233,13 +281,21 @@ def install():
 @click.option('--scan-id', type=int, help='Specific scan ID (uses latest if omitted)')
 def cronos(client, scan_id):
     """[OPTIONAL] Enrich Cronos scan with PHINEAS OSINT"""
+    from core.orchestrator import run_async
     from integrations.cronos_bridge import CronosBridge
     
     console.print(f"\n[bold cyan]PHINEAS x Cronos Integration[/bold cyan]\n")
     console.print("[yellow]Note: This is an optional integration feature[/yellow]\n")
     
     bridge = CronosBridge()
-    asyncio.run(bridge.enrich_client_scan(client, scan_id))
+    
+    async def enrich():
+        try:
+            await bridge.enrich_client_scan(client, scan_id)
+        finally:
+            await bridge.close()
+    
+    run_async(enrich())
 
 
 if __name__ == '__main__':
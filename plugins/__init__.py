@@ -4,13 +4,223 @@ Abstract base for all OSINT plugins
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, List
 import asyncio
+import functools
+import inspect
 import logging
+import os
+import signal
+import sys
+import time
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+from core.serialization import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Long-lived process that runs Python command-line tools without re-importing them
+_TOOL_WORKER_SCRIPT = Path(__file__).resolve().parent.parent / 'core' / 'tool_worker.py'
+_tool_worker = None
+
+# Connection pool shared by every plugin's session on one event loop
+_shared_http = None
+
+
+class _ToolWorker:
+    """Client for one core/tool_worker.py process, bound to an event loop"""
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.lock = asyncio.Lock()
+        self.process = None
+    
+    async def run(self, command: List[str], timeout: int) -> tuple:
+        """Send one job to the worker and wait for its reply"""
+        async with self.lock:
+            if self.process is None or self.process.returncode is not None:
+                self.process = await asyncio.create_subprocess_exec(
+                    sys.executable, str(_TOOL_WORKER_SCRIPT),
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    limit=64 * 1024 * 1024
+                )
+            
+            self.process.stdin.write(json_dumps({'command': command}) + b'\n')
+            
+            try:
+                await self.process.stdin.drain()
+                line = await asyncio.wait_for(self.process.stdout.readline(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # The job is still running inside the worker; start over next time
+                self.process.kill()
+                await self.process.wait()
+                self.process = None
+                raise
+            
+            if not line:
+                self.process = None
+                raise RuntimeError("Tool worker exited unexpectedly")
+            
+            reply = json_loads(line)
+            return reply['stdout'], reply['stderr'], reply['returncode']
+
+
+class CommandStream:
+    """
+    Run a command and iterate over its stdout line by line as it arrives
+    
+    Use as an async context manager; after iteration, returncode and
+    stderr are available. Only one line is held in memory at a time.
+    """
+    
+    def __init__(self, command: List[str], timeout: int = 300):
+        self.command = command
+        self.timeout = timeout
+        self.process = None
+        self.returncode = None
+        self.stderr = ''
+        self.lines_read = 0
+        self._deadline = None
+        self._stderr_task = None
+    
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        self._deadline = loop.time() + self.timeout
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=16 * 1024 * 1024,
+            # Own process group, so a timeout also kills the tool's children
+            start_new_session=True
+        )
+        # Drain stderr alongside stdout so a chatty tool cannot block on it
+        self._stderr_task = asyncio.ensure_future(self.process.stderr.read())
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.returncode = await self.process.wait()
+            self.stderr = (await self._stderr_task).decode('utf-8', errors='ignore')
+            return
+        
+        # Timed out or failed mid-stream: kill the tool and its children and
+        # skip the stderr drain. wait() also waits for the pipes to close,
+        # which an orphaned child can hold open, so it is bounded too.
+        self._kill()
+        self._stderr_task.cancel()
+        try:
+            self.returncode = await asyncio.wait_for(self.process.wait(), timeout=1)
+        except asyncio.TimeoutError:
+            self.returncode = self.process.returncode
+    
+    def _kill(self):
+        """Kill the tool's process group (just the tool where groups do not exist)"""
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+        except ProcessLookupError:
+            pass
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> str:
+        remaining = self._deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        
+        line = await asyncio.wait_for(self.process.stdout.readline(), timeout=remaining)
+        if not line:
+            raise StopAsyncIteration
+        
+        self.lines_read += 1
+        return line.decode('utf-8', errors='ignore').rstrip('\r\n')
+
+
+def _get_tool_worker() -> _ToolWorker:
+    """Return the tool worker for the running event loop"""
+    global _tool_worker
+    loop = asyncio.get_running_loop()
+    if _tool_worker is None or _tool_worker.loop is not loop:
+        _tool_worker = _ToolWorker(loop)
+    return _tool_worker
+
+
+class _SharedHTTP:
+    """aiohttp connector and per-host request slots for one event loop"""
+    
+    # Sockets across all plugins, and per host
+    LIMIT = 100
+    LIMIT_PER_HOST = 20
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.connector = None
+        self.host_slots: Dict[str, asyncio.Semaphore] = {}
+    
+    def get_connector(self):
+        """Return the shared connector, creating it on first use"""
+        if self.connector is None or self.connector.closed:
+            import aiohttp
+            
+            self.connector = aiohttp.TCPConnector(
+                limit=self.LIMIT,
+                limit_per_host=self.LIMIT_PER_HOST,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            )
+        return self.connector
+    
+    def host_slot(self, host: str, limit: int) -> asyncio.Semaphore:
+        """Semaphore bounding requests in flight to one host (first limit wins)"""
+        slot = self.host_slots.get(host)
+        if slot is None:
+            slot = self.host_slots[host] = asyncio.Semaphore(limit)
+        return slot
+
+
+def _get_shared_http() -> _SharedHTTP:
+    """Return the shared HTTP pool for the running event loop"""
+    global _shared_http
+    loop = asyncio.get_running_loop()
+    if _shared_http is None or _shared_http.loop is not loop:
+        _shared_http = _SharedHTTP(loop)
+    return _shared_http
+
+
+async def close_shared_connector():
+    """Close the running loop's shared connector once every plugin is done"""
+    global _shared_http
+    if _shared_http is not None and _shared_http.loop is asyncio.get_running_loop():
+        if _shared_http.connector is not None:
+            await _shared_http.connector.close()
+        _shared_http = None
+
+
+@dataclass(**({'slots': True} if sys.version_info >= (3, 10) else {}))
+class SocialProfile:
+    """
+    Account found on a platform, emitted in findings['social_profiles']
+    
+    Fixed fields instead of a dict per hit. ResultAggregator converts these
+    to dicts without the None fields; the JSON encoders take them as is.
+    """
+    platform: str
+    url: Optional[str] = None
+    email: Optional[str] = None
+    username: Optional[str] = None
+    exists: bool = True
+    metadata: Optional[Dict] = None
+
 
 class PluginBase(ABC):
     """
@@ -21,11 +231,16 @@ class PluginBase(ABC):
     
     def __init__(self, target: str, config: Dict = None, api_keys: Dict = None):
         self.target = target
+        self._email, self._username, self._domain = self._parse_target(target)
         self.config = config or {}
         self.api_keys = api_keys or {}
         self.results = {}
-        self.start_time = None
-        self.end_time = None
+        # Durations come from the monotonic perf_counter; the wall clock is
+        # only recorded for the start_time/end_time fields of the result
+        self._t0 = None
+        self.start_wallclock = None
+        # aiohttp session shared by every request of one run, see get_session
+        self._session = None
         
     @abstractmethod
     async def run(self) -> Dict:
@@ -35,7 +250,7 @@ class PluginBase(ABC):
         Returns:
             Dict with structure:
             {
-                'status': 'success' | 'failed',
+                'status': 'success' | 'failed' | 'skipped',
                 'plugin': 'plugin_name',
                 'target': 'target_identifier',
                 'findings': {...},
@@ -45,17 +260,30 @@ class PluginBase(ABC):
         """
         pass
     
+    def _start_timer(self):
+        """Mark the start of the plugin run"""
+        self._t0 = time.perf_counter()
+        self.start_wallclock = time.time()
+    
     def _create_result(self, status: str, findings: Dict = None, error: str = None) -> Dict:
         """Helper to create standardized result dictionary"""
-        self.end_time = datetime.now()
+        if self._t0 is not None:
+            duration = time.perf_counter() - self._t0
+            start_time = datetime.fromtimestamp(self.start_wallclock).isoformat()
+            end_wallclock = self.start_wallclock + duration
+        else:
+            # Never started (skipped or rejected up front): a zero-length run
+            duration = 0
+            end_wallclock = time.time()
+            start_time = datetime.fromtimestamp(end_wallclock).isoformat()
         
         result = {
             'status': status,
             'plugin': self.__class__.__name__,
             'target': self.target,
-            'start_time': self.start_time.isoformat() if self.start_time else None,
-            'end_time': self.end_time.isoformat(),
-            'duration_seconds': (self.end_time - self.start_time).total_seconds() if self.start_time else 0,
+            'start_time': start_time,
+            'end_time': datetime.fromtimestamp(end_wallclock).isoformat(),
+            'duration_seconds': duration,
             'findings': findings or {},
             'metadata': self.config
         }
@@ -65,6 +293,48 @@ class PluginBase(ABC):
         
         return result
     
+    async def __aenter__(self):
+        await self.get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close_session()
+    
+    def get_session_headers(self) -> Dict[str, str]:
+        """Headers sent with every request on the shared session"""
+        return {}
+    
+    async def get_session(self):
+        """
+        Return the plugin's aiohttp session, creating it on first use
+        
+        Sessions of all plugins on a loop share one connector, so the
+        framework as a whole stays within its socket limits.
+        """
+        if self._session is None or self._session.closed:
+            import aiohttp
+            
+            self._session = aiohttp.ClientSession(
+                headers=self.get_session_headers(),
+                connector=_get_shared_http().get_connector(),
+                connector_owner=False
+            )
+        return self._session
+    
+    async def close_session(self):
+        """Close the plugin's session if one was opened (the connector stays open)"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def host_slot(self, url: str, limit: int = _SharedHTTP.LIMIT_PER_HOST) -> asyncio.Semaphore:
+        """Semaphore to hold while requesting url, shared per host by all plugins"""
+        return _get_shared_http().host_slot(urlparse(url).hostname, limit)
+    
+    def stream_command(self, command: List[str], timeout: int = 300) -> CommandStream:
+        """Run an external command, iterating over stdout lines as they arrive"""
+        return CommandStream(command, timeout)
+    
     async def execute_command(self, command: List[str], timeout: int = 300) -> tuple:
         """
         Execute an external command asynchronously
@@ -97,35 +367,40 @@ class PluginBase(ABC):
             logger.error(f"Command error: {e}")
             return ('', str(e), -1)
     
+    @staticmethod
+    def _parse_target(target: str) -> tuple:
+        """Split a target into (email, username, domain), computed once per plugin"""
+        if '@' in target:
+            parts = target.split('@')
+            return target, parts[0], parts[1]
+        elif target.startswith(('http://', 'https://')):
+            return None, None, urlparse(target).netloc
+        elif '.' in target:
+            return None, None, target
+        return None, None, None
+    
     def _extract_email_from_target(self) -> Optional[str]:
         """Extract email if target is an email address"""
-        if '@' in self.target:
-            return self.target
-        return None
+        return self._email
     
     def _extract_username_from_email(self) -> Optional[str]:
         """Extract username from email address"""
-        if '@' in self.target:
-            return self.target.split('@')[0]
-        return None
+        return self._username
     
     def _extract_domain_from_target(self) -> Optional[str]:
         """Extract domain from email or URL"""
-        if '@' in self.target:
-            return self.target.split('@')[1]
-        elif self.target.startswith('http'):
-            from urllib.parse import urlparse
-            return urlparse(self.target).netloc
-        elif '.' in self.target:
-            return self.target
-        return None
+        return self._domain
     
     def get_timeout(self) -> int:
         """Get timeout from config or use default"""
         return self.config.get('timeout', 300)
     
     def is_enabled(self) -> bool:
-        """Check if plugin is enabled"""
+        """
+        Check if plugin is enabled
+        
+        Checked first thing in run(), before any command, session or timer
+        """
         return not self.config.get('disabled', False)
 
 
@@ -139,36 +414,99 @@ class CommandLinePlugin(PluginBase):
     
     @abstractmethod
     def parse_output(self, stdout: str, stderr: str) -> Dict:
-        """Parse command output into structured findings"""
+        """Parse command output into structured findings (may be async)"""
         pass
     
+    async def parse_stream(self, lines) -> Dict:
+        """
+        Parse stdout lines as the command produces them
+        
+        Override to have run() stream output instead of buffering it.
+        The default joins the lines and defers to parse_output.
+        """
+        findings = self.parse_output('\n'.join([line async for line in lines]), '')
+        if inspect.isawaitable(findings):
+            findings = await findings
+        return findings
+    
+    def _streams_output(self) -> bool:
+        """Whether this plugin overrides parse_stream"""
+        return type(self).parse_stream is not CommandLinePlugin.parse_stream
+    
     async def run(self) -> Dict:
         """Execute command-line tool and parse results"""
-        self.start_time = datetime.now()
+        if not self.is_enabled():
+            return self._create_result('skipped')
+        
+        self._start_timer()
         
         try:
             command = self.get_command()
             timeout = self.get_timeout()
             
-            stdout, stderr, returncode = await self.execute_command(command, timeout)
+            if self._streams_output() and not self.config.get('persistent_worker', False):
+                return await self._run_streaming(command, timeout)
+            
+            if self.config.get('persistent_worker', False):
+                stdout, stderr, returncode = await self.execute_in_worker(command, timeout)
+            else:
+                stdout, stderr, returncode = await self.execute_command(command, timeout)
             
             if returncode != 0 and not stdout:
                 return self._create_result('failed', error=f"Command failed: {stderr}")
             
             findings = self.parse_output(stdout, stderr)
+            if inspect.isawaitable(findings):
+                findings = await findings
             return self._create_result('success', findings=findings)
         
         except Exception as e:
             logger.error(f"Plugin error: {e}")
             return self._create_result('failed', error=str(e))
+    
+    async def _run_streaming(self, command: List[str], timeout: int) -> Dict:
+        """Run the command and feed its output to parse_stream line by line"""
+        try:
+            async with self.stream_command(command, timeout) as stream:
+                findings = await self.parse_stream(stream)
+        except asyncio.TimeoutError:
+            logger.error(f"Command timeout: {' '.join(command)}")
+            return self._create_result('failed', error="Command failed: Command timeout")
+        except OSError as e:
+            logger.error(f"Command error: {e}")
+            return self._create_result('failed', error=f"Command failed: {e}")
+        
+        if stream.returncode != 0 and not stream.lines_read:
+            return self._create_result('failed', error=f"Command failed: {stream.stderr}")
+        
+        return self._create_result('success', findings=findings)
+    
+    async def execute_in_worker(self, command: List[str], timeout: int = 300) -> tuple:
+        """
+        Execute a command through the shared persistent tool worker
+        
+        Falls back to a fresh subprocess if the worker cannot be used
+        
+        Returns:
+            Tuple of (stdout, stderr, returncode)
+        """
+        try:
+            return await _get_tool_worker().run(command, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Command timeout: {' '.join(command)}")
+            return ('', 'Command timeout', -1)
+        except Exception as e:
+            logger.warning(f"Tool worker unavailable, running command directly: {e}")
+            return await self.execute_command(command, timeout)
 
 
 class APIPlugin(PluginBase):
     """Base class for plugins that use API calls"""
     
-    def __init__(self, target: str, config: Dict = None, api_keys: Dict = None):
-        super().__init__(target, config, api_keys)
-        self.api_key = self._get_api_key()
+    @functools.cached_property
+    def api_key(self) -> Optional[str]:
+        """API key for this plugin, looked up on first use"""
+        return self._get_api_key()
     
     @abstractmethod
     def get_api_key_name(self) -> str:
@@ -186,13 +524,19 @@ class APIPlugin(PluginBase):
     
     async def run(self) -> Dict:
         """Execute API plugin with key validation"""
+        if not self.is_enabled():
+            return self._create_result('skipped')
+        
         if not self.has_api_key():
             return self._create_result(
                 'failed',
                 error=f"API key not configured for {self.get_api_key_name()}"
             )
         
-        return await self.execute_api_call()
+        try:
+            return await self.execute_api_call()
+        finally:
+            await self.close_session()
     
     @abstractmethod
     async def execute_api_call(self) -> Dict:
@@ -205,7 +549,10 @@ class PythonPlugin(PluginBase):
     
     async def run(self) -> Dict:
         """Execute Python-based plugin"""
-        self.start_time = datetime.now()
+        if not self.is_enabled():
+            return self._create_result('skipped')
+        
+        self._start_timer()
         
         try:
             findings = await self.execute()
@@ -213,6 +560,8 @@ class PythonPlugin(PluginBase):
         except Exception as e:
             logger.error(f"Plugin error: {e}")
             return self._create_result('failed', error=str(e))
+        finally:
+            await self.close_session()
     
     @abstractmethod
     async def execute(self) -> Dict:
@@ -3,9 +3,67 @@ Have I Been Pwned Plugin - Check email breaches
 API: https://haveibeenpwned.com/API/v3
 """
 
-import aiohttp
-from typing import Dict
-from plugins import APIPlugin
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+from plugins import APIPlugin, json_loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Bodies at least this large (or of unknown length) are parsed as they arrive
+_STREAM_MIN_BYTES = 4096
+
+# (API field, finding field) pairs copied from each breach and paste record
+_BREACH_FIELDS = (
+    ('Name', 'name'),
+    ('Title', 'title'),
+    ('Domain', 'domain'),
+    ('BreachDate', 'breach_date'),
+    ('AddedDate', 'added_date'),
+    ('ModifiedDate', 'modified_date'),
+    ('PwnCount', 'pwn_count'),
+    ('Description', 'description'),
+    ('IsVerified', 'is_verified'),
+    ('IsFabricated', 'is_fabricated'),
+    ('IsSensitive', 'is_sensitive'),
+    ('IsRetired', 'is_retired'),
+    ('IsSpamList', 'is_spam_list'),
+)
+
+if msgspec is not None:
+    class _Breach(msgspec.Struct, rename='pascal'):
+        """Breach record decoded straight from the API (BreachDate -> breach_date)"""
+        name: Optional[str] = None
+        title: Optional[str] = None
+        domain: Optional[str] = None
+        breach_date: Optional[str] = None
+        added_date: Optional[str] = None
+        modified_date: Optional[str] = None
+        pwn_count: Optional[int] = None
+        description: Optional[str] = None
+        is_verified: Optional[bool] = None
+        is_fabricated: Optional[bool] = None
+        is_sensitive: Optional[bool] = None
+        is_retired: Optional[bool] = None
+        is_spam_list: Optional[bool] = None
+        data_classes: List[str] = []
+    
+    _breach_decoder = msgspec.json.Decoder(List[_Breach])
+
+_PASTE_FIELDS = (
+    ('Source', 'source'),
+    ('Id', 'id'),
+    ('Title', 'title'),
+    ('Date', 'date'),
+    ('EmailCount', 'email_count'),
+)
 
 
 class Plugin(APIPlugin):
@@ -18,6 +76,12 @@ class Plugin(APIPlugin):
     def get_api_key_name(self) -> str:
         return 'haveibeenpwned'
     
+    def get_session_headers(self) -> Dict[str, str]:
+        return {
+            'hibp-api-key': self.api_key,
+            'user-agent': 'PHINEAS-OSINT'
+        }
+    
     async def execute_api_call(self) -> Dict:
         """Query HIBP API"""
         findings = {
@@ -26,17 +90,22 @@ class Plugin(APIPlugin):
             'pastes': []
         }
         
-        try:
-            # Check breaches
-            breaches = await self._check_breaches()
-            findings['breaches'] = breaches
-            
-            # Check pastes (if API key allows)
-            pastes = await self._check_pastes()
-            findings['pastes'] = pastes
+        # Breach and paste lookups are independent, so overlap the requests
+        breaches, pastes = await asyncio.gather(
+            self._check_breaches(),
+            self._check_pastes(),  # (if API key allows)
+            return_exceptions=True
+        )
         
-        except Exception as e:
-            findings['error'] = str(e)
+        errors = []
+        for key, value in (('breaches', breaches), ('pastes', pastes)):
+            if isinstance(value, Exception):
+                errors.append(f"{key}: {value}")
+            else:
+                findings[key] = value
+        
+        if errors:
+            findings['error'] = '; '.join(errors)
         
         return findings
     
@@ -44,80 +113,67 @@ class Plugin(APIPlugin):
         """Check for breaches"""
         url = f"https://haveibeenpwned.com/api/v3/breachedaccount/{self.target}"
         
-        headers = {
-            'hibp-api-key': self.api_key,
-            'user-agent': 'PHINEAS-OSINT'
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    breaches = []
-                    for breach in data:
-                        breaches.append({
-                            'name': breach.get('Name'),
-                            'title': breach.get('Title'),
-                            'domain': breach.get('Domain'),
-                            'breach_date': breach.get('BreachDate'),
-                            'added_date': breach.get('AddedDate'),
-                            'modified_date': breach.get('ModifiedDate'),
-                            'pwn_count': breach.get('PwnCount'),
-                            'description': breach.get('Description'),
-                            'data_classes': breach.get('DataClasses', []),
-                            'is_verified': breach.get('IsVerified'),
-                            'is_fabricated': breach.get('IsFabricated'),
-                            'is_sensitive': breach.get('IsSensitive'),
-                            'is_retired': breach.get('IsRetired'),
-                            'is_spam_list': breach.get('IsSpamList')
-                        })
-                    
-                    return breaches
+        session = await self.get_session()
+        async with session.get(url) as response:
+            if response.status == 200:
+                if msgspec is not None:
+                    # Typed decode picks the fields in C, skipping the
+                    # per-key loop; records stay dicts for the aggregator
+                    body = await response.read()
+                    return [msgspec.structs.asdict(breach) for breach in _breach_decoder.decode(body)]
                 
-                elif response.status == 404:
-                    # No breaches found
-                    return []
-                else:
-                    # API error
-                    return []
+                breaches = []
+                async for breach in self._iter_json_array(response):
+                    record = {field: breach.get(key) for key, field in _BREACH_FIELDS}
+                    record['data_classes'] = breach.get('DataClasses', [])
+                    breaches.append(record)
+                
+                return breaches
+            
+            elif response.status == 404:
+                # No breaches found
+                return []
+            else:
+                # API error
+                return []
     
     async def _check_pastes(self) -> list:
         """Check for pastes"""
         url = f"https://haveibeenpwned.com/api/v3/pasteaccount/{self.target}"
         
-        headers = {
-            'hibp-api-key': self.api_key,
-            'user-agent': 'PHINEAS-OSINT'
-        }
-        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        pastes = []
-                        for paste in data:
-                            pastes.append({
-                                'source': paste.get('Source'),
-                                'id': paste.get('Id'),
-                                'title': paste.get('Title'),
-                                'date': paste.get('Date'),
-                                'email_count': paste.get('EmailCount')
-                            })
-                        
-                        return pastes
-                    else:
-                        return []
+            session = await self.get_session()
+            async with session.get(url) as response:
+                if response.status == 200:
+                    return [
+                        {field: paste.get(key) for key, field in _PASTE_FIELDS}
+                        async for paste in self._iter_json_array(response)
+                    ]
+                else:
+                    return []
         except Exception:
             return []
+    
+    async def _iter_json_array(self, response) -> AsyncIterator[Any]:
+        """
+        Yield the items of a JSON array response
+        
+        Large responses are stream-parsed with ijson when it is installed,
+        so records are trimmed while the body is still downloading.
+        """
+        length = response.content_length
+        if ijson is not None and (length is None or length >= _STREAM_MIN_BYTES):
+            async for item in ijson.items(response.content, 'item', use_float=True):
+                yield item
+        else:
+            for item in json_loads(await response.read()):
+                yield item
 
 
 # Standalone execution
 if __name__ == '__main__':
-    import asyncio
     import sys
+    from core.orchestrator import run_async
     import os
     
     if len(sys.argv) < 2:
@@ -131,7 +187,7 @@ if __name__ == '__main__':
         sys.exit(1)
     
     plugin = Plugin(target=sys.argv[1], api_keys={'haveibeenpwned': api_key})
-    result = asyncio.run(plugin.run())
+    result = run_async(plugin.run())
     
     import json
     print(json.dumps(result, indent=2))
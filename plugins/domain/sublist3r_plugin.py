@@ -3,10 +3,22 @@ Sublist3r Plugin - Subdomain enumeration
 GitHub: https://github.com/aboul3la/Sublist3r
 """
 
+import asyncio
+import functools
 import json
+import os
+import re
 from typing import Dict, List
 from plugins import CommandLinePlugin
 
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+# Terminal colour codes that sublist3r wraps around results
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
 
 class Plugin(CommandLinePlugin):
     """
@@ -16,6 +28,12 @@ class Plugin(CommandLinePlugin):
     Uses search engines and public sources
     """
     
+    @functools.cached_property
+    def _output_file(self) -> str:
+        """Path sublist3r writes its results to, built once per plugin"""
+        domain = self._extract_domain_from_target() or self.target
+        return f'/tmp/sublist3r_{domain}.txt'
+    
     def get_command(self) -> List[str]:
         """Build sublist3r command"""
         domain = self._extract_domain_from_target()
@@ -25,7 +43,7 @@ class Plugin(CommandLinePlugin):
         command = [
             'sublist3r',
             '-d', domain,
-            '-o', f'/tmp/sublist3r_{domain}.txt'
+            '-o', self._output_file
         ]
         
         # Add optional bruteforce (slower)
@@ -38,53 +56,85 @@ class Plugin(CommandLinePlugin):
         
         return command
     
-    def parse_output(self, stdout: str, stderr: str) -> Dict:
+    async def parse_output(self, stdout: str, stderr: str) -> Dict:
         """Parse sublist3r output"""
-        findings = {
-            'domains': [],
-            'subdomains': []
-        }
-        
         domain = self._extract_domain_from_target() or self.target
-        findings['domains'].append(domain)
+        suffix = '.' + domain
+        subdomains = set()
+        
+        if '\x1b' in stdout:
+            stdout = _ANSI_RE.sub('', stdout)
         
         # Parse stdout
         for line in stdout.split('\n'):
             line = line.strip()
             
-            # Subdomains are printed as-is
-            if '.' in line and domain in line:
-                findings['subdomains'].append(line)
+            # Subdomains are printed as-is; match on the domain suffix so
+            # status lines and look-alike hosts (foo.com.evil) are skipped
+            if line.endswith(suffix) or line == domain:
+                subdomains.add(line)
         
-        # Try to read output file
-        try:
-            import os
-            output_file = f'/tmp/sublist3r_{domain}.txt'
+        return await self._finish_findings(domain, subdomains)
+    
+    async def parse_stream(self, lines) -> Dict:
+        """Parse sublist3r output line by line while it runs"""
+        domain = self._extract_domain_from_target() or self.target
+        suffix = '.' + domain
+        subdomains = set()
+        
+        async for line in lines:
+            if '\x1b' in line:
+                line = _ANSI_RE.sub('', line)
+            line = line.strip()
             
-            if os.path.exists(output_file):
-                with open(output_file) as f:
-                    for line in f:
-                        subdomain = line.strip()
-                        if subdomain:
-                            findings['subdomains'].append(subdomain)
+            if line.endswith(suffix) or line == domain:
+                subdomains.add(line)
+        
+        return await self._finish_findings(domain, subdomains)
+    
+    async def _finish_findings(self, domain: str, subdomains: set) -> Dict:
+        """Merge the output file into the stdout results and build findings"""
+        # Try to read output file; one stat covers both existence and emptiness
+        try:
+            if os.stat(self._output_file).st_size:
+                subdomains.update(await self._read_output_file(self._output_file))
         except Exception:
             pass
         
-        # Deduplicate
-        findings['subdomains'] = sorted(list(set(findings['subdomains'])))
+        return {
+            'domains': [domain],
+            'subdomains': sorted(subdomains)
+        }
+    
+    async def _read_output_file(self, path: str) -> List[str]:
+        """Read subdomains from the output file without blocking the event loop"""
+        if aiofiles is None:
+            return await asyncio.to_thread(self._read_lines, path)
         
-        return findings
+        subdomains = []
+        async with aiofiles.open(path) as f:
+            async for line in f:
+                subdomain = line.strip()
+                if subdomain:
+                    subdomains.append(subdomain)
+        return subdomains
+    
+    @staticmethod
+    def _read_lines(path: str) -> List[str]:
+        """Synchronous fallback for _read_output_file"""
+        with open(path) as f:
+            return [line.strip() for line in f if line.strip()]
 
 
 # Standalone execution
 if __name__ == '__main__':
-    import asyncio
     import sys
+    from core.orchestrator import run_async
     
     if len(sys.argv) < 2:
         print("Usage: python sublist3r_plugin.py <domain>")
         sys.exit(1)
     
     plugin = Plugin(target=sys.argv[1])
-    result = asyncio.run(plugin.run())
+    result = run_async(plugin.run())
     print(json.dumps(result, indent=2))
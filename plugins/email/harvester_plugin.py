@@ -4,9 +4,14 @@ GitHub: https://github.com/laramies/theHarvester
 """
 
 import json
+import re
 from typing import Dict, List
 from plugins import CommandLinePlugin
 
+# Section headers in theHarvester's text report; the group number selects the section
+_SECTION_RE = re.compile(r'(Emails found:)|(Hosts found:)|(Interesting)')
+_SECTIONS = {1: 'emails', 2: 'hosts', 3: 'urls'}
+
 
 class Plugin(CommandLinePlugin):
     """
@@ -40,46 +45,65 @@ class Plugin(CommandLinePlugin):
     
     def parse_output(self, stdout: str, stderr: str) -> Dict:
         """Parse theHarvester output"""
-        findings = {
-            'emails': [],
-            'subdomains': [],
-            'hosts': [],
-            'urls': []
-        }
+        findings = self._new_findings()
         
         # Parse text output
         current_section = None
-        
         for line in stdout.split('\n'):
-            line = line.strip()
-            
-            if 'Emails found:' in line:
-                current_section = 'emails'
-                continue
-            elif 'Hosts found:' in line:
-                current_section = 'hosts'
-                continue
-            elif 'Interesting' in line:
-                current_section = 'urls'
-                continue
-            
-            if not line or line.startswith('['):
-                continue
-            
-            if current_section == 'emails':
-                if '@' in line:
-                    findings['emails'].append(line)
-            elif current_section == 'hosts':
-                if ':' in line:
-                    parts = line.split(':')
-                    host = parts[0].strip()
-                    if '.' in host:
-                        findings['subdomains'].append(host)
-                        findings['hosts'].append(line)
-            elif current_section == 'urls':
-                if line.startswith('http'):
-                    findings['urls'].append(line)
+            current_section = self._parse_line(findings, current_section, line)
+        
+        return self._finish_findings(findings)
+    
+    async def parse_stream(self, lines) -> Dict:
+        """Parse theHarvester output line by line while it runs"""
+        findings = self._new_findings()
+        
+        current_section = None
+        async for line in lines:
+            current_section = self._parse_line(findings, current_section, line)
         
+        return self._finish_findings(findings)
+    
+    @staticmethod
+    def _new_findings() -> Dict[str, set]:
+        """Empty findings; sets deduplicate while parsing and merge the JSON report by union"""
+        return {
+            'emails': set(),
+            'subdomains': set(),
+            'hosts': set(),
+            'urls': set()
+        }
+    
+    @staticmethod
+    def _parse_line(findings: Dict[str, set], current_section, line: str):
+        """Record one line of the text report and return the active section"""
+        line = line.strip()
+        
+        header = _SECTION_RE.search(line)
+        if header:
+            return _SECTIONS[header.lastindex]
+        
+        if not line or line.startswith('['):
+            return current_section
+        
+        if current_section == 'emails':
+            if '@' in line:
+                findings['emails'].add(line)
+        elif current_section == 'hosts':
+            if ':' in line:
+                parts = line.split(':')
+                host = parts[0].strip()
+                if '.' in host:
+                    findings['subdomains'].add(host)
+                    findings['hosts'].add(line)
+        elif current_section == 'urls':
+            if line.startswith('http'):
+                findings['urls'].add(line)
+        
+        return current_section
+    
+    def _finish_findings(self, findings: Dict[str, set]) -> Dict:
+        """Merge the JSON report, if any, and convert findings to lists"""
         # Try to read JSON output file if it exists
         try:
             domain = self._extract_domain_from_target() or self.target
@@ -90,31 +114,23 @@ class Plugin(CommandLinePlugin):
                 with open(json_file) as f:
                     data = json.load(f)
                     
-                    if 'emails' in data:
-                        findings['emails'].extend(data['emails'])
-                    if 'hosts' in data:
-                        findings['subdomains'].extend(data['hosts'])
+                    findings['emails'].update(data.get('emails', ()))
+                    findings['subdomains'].update(data.get('hosts', ()))
         except Exception:
             pass
         
-        # Deduplicate
-        findings['emails'] = list(set(findings['emails']))
-        findings['subdomains'] = list(set(findings['subdomains']))
-        findings['hosts'] = list(set(findings['hosts']))
-        findings['urls'] = list(set(findings['urls']))
-        
-        return findings
+        return {key: list(values) for key, values in findings.items()}
 
 
 # Standalone execution
 if __name__ == '__main__':
-    import asyncio
     import sys
+    from core.orchestrator import run_async
     
     if len(sys.argv) < 2:
         print("Usage: python harvester_plugin.py <domain>")
         sys.exit(1)
     
     plugin = Plugin(target=sys.argv[1])
-    result = asyncio.run(plugin.run())
+    result = run_async(plugin.run())
     print(json.dumps(result, indent=2))
@@ -5,8 +5,12 @@ GitHub: https://github.com/megadose/holehe
 
 import json
 import asyncio
+import re
 from typing import Dict
-from plugins import PythonPlugin
+from plugins import PythonPlugin, SocialProfile
+
+# Site name following a hit marker ("[+] twitter.com"), up to any colour code
+_HIT_RE = re.compile(r'(?:\[\+\]|✓)\s+([^\s\x1b]+)')
 
 
 class Plugin(PythonPlugin):
@@ -26,11 +30,7 @@ class Plugin(PythonPlugin):
         }
         
         try:
-            # Import holehe if available
-            import holehe
-            from holehe.core import *
-            
-            # Run holehe check
+            # Run holehe check (ImportError if the library is missing)
             results = await self._run_holehe_check()
             
             for site, data in results.items():
@@ -38,13 +38,12 @@ class Plugin(PythonPlugin):
                     findings['accounts'].append(site)
                     
                     if data.get('url'):
-                        findings['social_profiles'].append({
-                            'platform': site,
-                            'email': self.target,
-                            'url': data.get('url'),
-                            'exists': True,
-                            'metadata': data
-                        })
+                        findings['social_profiles'].append(SocialProfile(
+                            platform=site,
+                            email=self.target,
+                            url=data.get('url'),
+                            metadata=data
+                        ))
         
         except ImportError:
             # Fallback to command line
@@ -56,10 +55,37 @@ class Plugin(PythonPlugin):
         return findings
     
     async def _run_holehe_check(self) -> Dict:
-        """Run holehe check using library"""
-        # This would use the holehe Python library
-        # For now, we'll use command line
-        return await self._run_command_line()
+        """
+        Run every holehe site module in-process
+        
+        All checks share one httpx client, so connections are pooled and
+        there is no process startup or stdout parsing.
+        
+        Returns:
+            Dict of {site: {'exists', 'url', 'metadata'}}
+        """
+        import httpx
+        from holehe.core import get_functions, import_submodules, launch_module
+        
+        modules = get_functions(import_submodules('holehe.modules'))
+        out = []
+        
+        async with httpx.AsyncClient(timeout=self.config.get('timeout_per_site', 10)) as client:
+            await asyncio.gather(*(
+                launch_module(module, self.target, client, out)
+                for module in modules
+            ))
+        
+        results = {}
+        for entry in out:
+            domain = entry.get('domain')
+            results[entry.get('name', domain)] = {
+                'exists': entry.get('exists', False),
+                'url': f'https://{domain}' if domain else None,
+                'metadata': entry
+            }
+        
+        return results
     
     async def _run_command_line(self) -> Dict:
         """Run holehe as command line tool"""
@@ -67,28 +93,26 @@ class Plugin(PythonPlugin):
         
         stdout, stderr, returncode = await self.execute_command(command)
         
+        # Parse in a worker thread so a large output does not hold up the loop
+        return await asyncio.to_thread(self._parse_holehe_output, stdout)
+    
+    def _parse_holehe_output(self, stdout: str) -> Dict:
+        """Build findings from holehe's CLI output"""
         findings = {
             'emails': [self.target],
             'accounts': [],
             'social_profiles': []
         }
         
-        # Parse output
-        for line in stdout.split('\n'):
-            line = line.strip()
-            
-            # Look for [+] indicators
-            if '[+]' in line or '✓' in line:
-                # Extract platform name
-                for word in line.split():
-                    if word and not word.startswith('[') and word not in ['on', 'used']:
-                        findings['accounts'].append(word)
-                        findings['social_profiles'].append({
-                            'platform': word,
-                            'email': self.target,
-                            'exists': True
-                        })
-                        break
+        # Parse output: one regex pass finds every [+] / ✓ hit, and a set
+        # drops sites reported more than once
+        accounts = set(match.group(1) for match in _HIT_RE.finditer(stdout))
+        
+        findings['accounts'] = sorted(accounts)
+        findings['social_profiles'] = [
+            SocialProfile(platform=platform, email=self.target)
+            for platform in findings['accounts']
+        ]
         
         return findings
 
@@ -96,11 +120,13 @@ class Plugin(PythonPlugin):
 # Standalone execution
 if __name__ == '__main__':
     import sys
+    from core.orchestrator import run_async
+    from dataclasses import asdict
     
     if len(sys.argv) < 2:
         print("Usage: python holehe_plugin.py <email>")
         sys.exit(1)
     
     plugin = Plugin(target=sys.argv[1])
-    result = asyncio.run(plugin.run())
-    print(json.dumps(result, indent=2))
+    result = run_async(plugin.run())
+    print(json.dumps(result, indent=2, default=asdict))
@@ -4,9 +4,57 @@ API: https://archive.org/help/wayback_api.php
 """
 
 import aiohttp
-from typing import Dict
+import asyncio
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
 from datetime import datetime, timedelta
-from plugins import PythonPlugin
+from plugins import PythonPlugin, json_dumps, json_loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Archive answers barely change over days, so they are kept on disk and
+# shared across runs: fresh for 30 days, then served for 30 more days only
+# when the archive cannot be reached. Empty answers are retried after an hour.
+_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'phineas' / 'wayback'
+_CACHE_TTL = timedelta(days=30).total_seconds()
+_STALE_TTL = timedelta(days=30).total_seconds()
+_NEGATIVE_TTL = timedelta(hours=1).total_seconds()
+
+# Fail fast on connect and stalled reads so a slow reply frees its pooled
+# connection well before the overall deadline
+_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=5, sock_connect=5, sock_read=30)
+
+# Requests in flight to each archive.org host, across all plugin instances
+_HOST_SLOTS = 10
+
+
+def _read_cache_entry(path: Path) -> Optional[Dict]:
+    """Load a cache entry, or None if it is missing or unreadable"""
+    try:
+        entry = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if isinstance(entry, dict) and 'stored' in entry and 'value' in entry:
+        return entry
+    return None
+
+
+def _write_cache_entry(path: Path, entry: Dict):
+    """Store a cache entry atomically; caching is best effort"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_bytes(json_dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
 
 
 class Plugin(PythonPlugin):
@@ -31,98 +79,199 @@ class Plugin(PythonPlugin):
         
         findings['domains'].append(domain)
         
-        try:
-            # Get URL list
-            urls = await self._get_urls(domain)
-            findings['urls'] = urls
-            
-            # Get snapshots
-            snapshots = await self._get_snapshots(domain)
+        errors = []
+        
+        # A one-row CDX probe over the same *.domain/* scope tells whether
+        # the full scan can find anything; it overlaps the availability
+        # lookup. Only a definite "no captures" skips the scan: if the
+        # probe fails the answer is unknown and the scan still runs.
+        snapshots, probe = await asyncio.gather(
+            self._get_snapshots(domain),
+            self._cached('cdx', self._cdx_params(domain, limit=1), self._fetch_urls),
+            return_exceptions=True
+        )
+        
+        if isinstance(snapshots, Exception):
+            errors.append(f"snapshots: {snapshots}")
+        else:
             findings['snapshots'] = snapshots
         
-        except Exception as e:
-            findings['error'] = str(e)
+        if isinstance(probe, Exception) or probe:
+            findings['urls'] = await self._get_urls(domain)
+        
+        if errors:
+            findings['error'] = '; '.join(errors)
         
         return findings
     
-    async def _get_urls(self, domain: str) -> list:
-        """Get list of URLs from CDX API"""
-        url = f"http://web.archive.org/cdx/search/cdx"
-        
-        params = {
+    def _cdx_params(self, domain: str, limit: int) -> Dict:
+        """CDX query for every capture under the domain and its subdomains"""
+        return {
             'url': f'*.{domain}/*',
             'output': 'json',
             'fl': 'original,timestamp,statuscode',
             'collapse': 'urlkey',
-            'limit': self.config.get('limit', 1000)
+            'limit': limit
         }
-        
-        urls = []
+    
+    async def _get_urls(self, domain: str) -> list:
+        """Get list of URLs from CDX API"""
+        params = self._cdx_params(domain, self.config.get('limit', 1000))
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=60) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Skip header row
-                        for row in data[1:]:
-                            if len(row) >= 3:
-                                original_url = row[0]
-                                timestamp = row[1]
-                                status_code = row[2]
-                                
-                                urls.append({
-                                    'url': original_url,
-                                    'timestamp': timestamp,
-                                    'status': status_code
-                                })
+            return await self._cached('cdx', params, self._fetch_urls)
         except Exception:
-            pass
+            return []
+    
+    async def _fetch_urls(self, params: Dict) -> list:
+        """
+        Download the CDX URL table, page by page
+        
+        Pages are chained with CDX resume keys, so 'limit' caps the total
+        while each response stays at most 'page_size' rows. A page's key
+        only arrives at its end, so pages are fetched one after another.
+        """
+        limit = params['limit']
+        page_size = self.config.get('page_size', 5000)
+        query = {**params, 'showResumeKey': 'true'}
+        
+        urls = []
+        
+        while len(urls) < limit:
+            query['limit'] = min(page_size, limit - len(urls))
+            resume_key = await self._fetch_url_page(query, urls)
+            if not resume_key:
+                break
+            query['resumeKey'] = resume_key
         
         return urls
     
-    async def _get_snapshots(self, domain: str) -> list:
-        """Get snapshot availability"""
-        url = f"http://archive.org/wayback/available"
+    async def _fetch_url_page(self, query: Dict, urls: list) -> Optional[str]:
+        """Append one CDX page to urls and return its resume key, if any"""
+        url = f"https://web.archive.org/cdx/search/cdx"
+        
+        resume_key = None
+        
+        session = await self.get_session()
+        async with self.host_slot(url, _HOST_SLOTS), \
+                session.get(url, params=query, timeout=_TIMEOUT) as response:
+            if response.status != 200:
+                raise ValueError(f"CDX API returned HTTP {response.status}")
+            
+            rows = self._iter_rows(response)
+            
+            # Skip header row
+            async for row in rows:
+                break
+            
+            # An empty row separates the results from the [resume key] row
+            async for row in rows:
+                if len(row) >= 3:
+                    original_url = row[0]
+                    timestamp = row[1]
+                    status_code = row[2]
+                    
+                    urls.append({
+                        'url': original_url,
+                        'timestamp': timestamp,
+                        'status': status_code
+                    })
+                elif len(row) == 1:
+                    resume_key = row[0]
+        
+        return resume_key
+    
+    async def _iter_rows(self, response) -> AsyncIterator[Any]:
+        """
+        Yield the rows of a CDX JSON response
         
+        With ijson installed the rows are parsed as the body arrives,
+        instead of buffering the whole table first.
+        """
+        if ijson is not None:
+            async for row in ijson.items(response.content, 'item'):
+                yield row
+        else:
+            for row in json_loads(await response.read()):
+                yield row
+    
+    async def _get_snapshots(self, domain: str) -> list:
+        """Get snapshot availability, raising if the archive cannot be asked"""
         params = {
             'url': domain
         }
         
+        return await self._cached('available', params, self._fetch_snapshots)
+    
+    async def _fetch_snapshots(self, params: Dict) -> list:
+        """Look up the closest archived snapshot"""
+        url = f"https://archive.org/wayback/available"
+        
         snapshots = []
         
+        session = await self.get_session()
+        async with self.host_slot(url, _HOST_SLOTS), \
+                session.get(url, params=params, timeout=_TIMEOUT) as response:
+            if response.status != 200:
+                raise ValueError(f"Availability API returned HTTP {response.status}")
+            
+            data = await response.json(loads=json_loads)
+            
+            if data.get('archived_snapshots'):
+                closest = data['archived_snapshots'].get('closest')
+                if closest:
+                    snapshots.append({
+                        'url': closest.get('url'),
+                        'timestamp': closest.get('timestamp'),
+                        'status': closest.get('status'),
+                        'available': closest.get('available')
+                    })
+        
+        return snapshots
+    
+    async def _cached(self, api: str, params: Dict, fetch: Callable[[Dict], Awaitable[list]]) -> list:
+        """
+        Return fetch(params) through the on-disk cache
+        
+        Fresh entries are returned without a request. Entries past their
+        TTL but inside the stale window are still served if the archive
+        cannot be reached. Empty results expire after an hour. Only
+        answers are stored: when fetch raises, nothing is written, so a
+        failure is never cached as "nothing archived".
+        """
+        if not self.config.get('cache', True):
+            return await fetch(params)
+        
+        key = json.dumps([api, params], sort_keys=True)
+        path = _CACHE_DIR / f"{hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()}.json"
+        
+        entry = await asyncio.to_thread(_read_cache_entry, path)
+        if entry is not None:
+            age = time.time() - entry['stored']
+            ttl = _CACHE_TTL if entry['value'] else _NEGATIVE_TTL
+            if age < ttl:
+                return entry['value']
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if data.get('archived_snapshots'):
-                            closest = data['archived_snapshots'].get('closest')
-                            if closest:
-                                snapshots.append({
-                                    'url': closest.get('url'),
-                                    'timestamp': closest.get('timestamp'),
-                                    'status': closest.get('status'),
-                                    'available': closest.get('available')
-                                })
+            value = await fetch(params)
         except Exception:
-            pass
+            if entry is not None and age < ttl + _STALE_TTL:
+                return entry['value']
+            raise
         
-        return snapshots
+        await asyncio.to_thread(_write_cache_entry, path, {'stored': time.time(), 'value': value})
+        return value
 
 
 # Standalone execution
 if __name__ == '__main__':
-    import asyncio
     import sys
-    import json
+    from core.orchestrator import run_async
     
     if len(sys.argv) < 2:
         print("Usage: python wayback_plugin.py <domain>")
         sys.exit(1)
     
     plugin = Plugin(target=sys.argv[1])
-    result = asyncio.run(plugin.run())
+    result = run_async(plugin.run())
     print(json.dumps(result, indent=2))
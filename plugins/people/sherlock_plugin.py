@@ -3,12 +3,17 @@ Sherlock Plugin - Username enumeration across 300+ social networks
 GitHub: https://github.com/sherlock-project/sherlock
 """
 
+import asyncio
 import json
+import re
 from typing import Dict
-from plugins import CommandLinePlugin
+from plugins import PythonPlugin, SocialProfile, json_loads
 
+# Text-mode hit: "[+] Platform: https://url" (the URL stops at any colour code)
+_TEXT_HIT_RE = re.compile(r'\[\+\]\s*([^:\n]+?)\s*:\s*([^\s\x1b]+)')
 
-class Plugin(CommandLinePlugin):
+
+class Plugin(PythonPlugin):
     """
     Sherlock username search across social media platforms
     
@@ -16,12 +21,79 @@ class Plugin(CommandLinePlugin):
     Searches 300+ social networks
     """
     
-    def get_command(self):
-        """Build sherlock command"""
-        # Extract username from target
+    def _get_username(self) -> str:
+        """Username to search for, taken from an email target if needed"""
         username = self.target
         if '@' in username:
             username = self._extract_username_from_email()
+        return username
+    
+    async def execute(self) -> Dict:
+        """
+        Run sherlock in-process, or through its CLI if it is not importable
+        
+        The in-process run is bounded by the plugin timeout. A thread cannot
+        be cancelled, so on timeout the plugin fails while the worker thread
+        keeps running in the background until sherlock's own per-site
+        timeouts let it finish.
+        """
+        timeout = self.get_timeout()
+        try:
+            # sherlock's checks are blocking requests calls: keep them off the loop
+            return await asyncio.wait_for(asyncio.to_thread(self._run_sherlock), timeout)
+        except ImportError:
+            return await self._run_command_line()
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"sherlock timed out after {timeout}s")
+    
+    def _run_sherlock(self) -> Dict:
+        """Query every site with the sherlock library and read its results directly"""
+        from sherlock_project.notify import QueryNotify
+        from sherlock_project.result import QueryStatus
+        from sherlock_project.sherlock import sherlock
+        from sherlock_project.sites import SitesInformation
+        
+        sites = SitesInformation()
+        # Same default as the CLI, which only checks NSFW sites on request
+        sites.remove_nsfw_sites()
+        site_data = {site.name: site.information for site in sites}
+        
+        username = self._get_username()
+        results = sherlock(
+            username,
+            site_data,
+            QueryNotify(),
+            timeout=self.config.get('timeout_per_site', 10)
+        )
+        
+        profiles = [
+            SocialProfile(
+                platform=platform,
+                username=username,
+                url=info['url_user']
+            )
+            for platform, info in results.items()
+            if info.get('status') is not None and info['status'].status == QueryStatus.CLAIMED
+        ]
+        
+        return {
+            'usernames': [username],
+            'social_profiles': profiles,
+            'accounts': sorted(profile.platform for profile in profiles)
+        }
+    
+    async def _run_command_line(self) -> Dict:
+        """Run sherlock as command line tool"""
+        stdout, stderr, returncode = await self.execute_command(self.get_command(), self.get_timeout())
+        
+        if returncode != 0 and not stdout:
+            raise RuntimeError(f"Command failed: {stderr}")
+        
+        return self.parse_output(stdout, stderr)
+    
+    def get_command(self):
+        """Build sherlock command"""
+        username = self._get_username()
         
         command = ['sherlock', username, '--json', '--timeout', '10']
         
@@ -39,55 +111,54 @@ class Plugin(CommandLinePlugin):
             'accounts': []
         }
         
+        # Deduplicated while parsing: profiles by (platform, url), accounts by name
+        profiles = {}
+        accounts = set()
+        
         try:
             # Sherlock outputs multiple JSON objects, one per username
-            for line in stdout.strip().split('\n'):
-                if line and line.startswith('{'):
-                    data = json.loads(line)
-                    
-                    for platform, info in data.items():
-                        if isinstance(info, dict) and info.get('url_user'):
-                            findings['social_profiles'].append({
-                                'platform': platform,
-                                'username': info.get('url_user').split('/')[-1],
-                                'url': info.get('url_user'),
-                                'exists': True
-                            })
-                            
-                            findings['accounts'].append(platform)
+            for line in stdout.splitlines():
+                if not line or line[0] != '{':
+                    continue
+                
+                data = json_loads(line)
+                
+                for platform, info in data.items():
+                    if isinstance(info, dict) and info.get('url_user'):
+                        profiles.setdefault((platform, info['url_user']), SocialProfile(
+                            platform=platform,
+                            username=info['url_user'].split('/')[-1],
+                            url=info['url_user']
+                        ))
+                        
+                        accounts.add(platform)
         
         except json.JSONDecodeError:
-            # Fallback: parse text output
-            for line in stdout.split('\n'):
-                if '[+]' in line:
-                    parts = line.split(':', 1)
-                    if len(parts) == 2:
-                        platform = parts[0].replace('[+]', '').strip()
-                        url = parts[1].strip()
-                        findings['social_profiles'].append({
-                            'platform': platform,
-                            'url': url,
-                            'exists': True
-                        })
+            # (orjson's JSONDecodeError subclasses this one)
+            # Fallback: parse text output in one regex pass
+            for match in _TEXT_HIT_RE.finditer(stdout):
+                platform, url = match.groups()
+                profiles.setdefault((platform, url), SocialProfile(platform=platform, url=url))
+        
+        findings['social_profiles'] = list(profiles.values())
+        findings['accounts'] = sorted(accounts)
         
         # Add target username to findings
-        username = self.target
-        if '@' in username:
-            username = self._extract_username_from_email()
-        findings['usernames'].append(username)
+        findings['usernames'].append(self._get_username())
         
         return findings
 
 
 # Standalone execution
 if __name__ == '__main__':
-    import asyncio
     import sys
+    from core.orchestrator import run_async
+    from dataclasses import asdict
     
     if len(sys.argv) < 2:
         print("Usage: python sherlock_plugin.py <username>")
         sys.exit(1)
     
     plugin = Plugin(target=sys.argv[1])
-    result = asyncio.run(plugin.run())
-    print(json.dumps(result, indent=2))
+    result = run_async(plugin.run())
+    print(json.dumps(result, indent=2, default=asdict))
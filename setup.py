@@ -7,10 +7,11 @@ long_description = readme_file.read_text() if readme_file.exists() else ""
 
 # Read requirements
 requirements_file = Path(__file__).parent / "requirements.txt"
-requirements = []
-if requirements_file.exists():
-    with open(requirements_file) as f:
-        requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+requirements_text = requirements_file.read_text() if requirements_file.exists() else ""
+requirements = [
+    line for line in map(str.strip, requirements_text.splitlines())
+    if line and not line.startswith('#')
+]
 
 setup(
     name="phineas-osint",
@@ -20,7 +21,12 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/phineas-osint",
-    packages=find_packages(),
+    # Only scan the framework's own packages, not the whole checkout
+    packages=find_packages(include=[
+        'core', 'core.*',
+        'plugins', 'plugins.*',
+        'integrations', 'integrations.*',
+    ]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Information Technology",
@@ -40,7 +46,8 @@ setup(
             'phineas=phineas:cli',
         ],
     },
-    include_package_data=True,
+    # Data files come from package_data alone; no MANIFEST.in scan
+    include_package_data=False,
     package_data={
         '': ['*.yaml', '*.yml', '*.json'],
     },
@@ -0,0 +1,84 @@
+"""
+Wayback plugin: the CDX scan gate and the on-disk cache
+"""
+
+import asyncio
+
+import pytest
+
+from plugins.passive import wayback_plugin
+from plugins.passive.wayback_plugin import Plugin
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(wayback_plugin, '_CACHE_DIR', tmp_path)
+    return tmp_path
+
+
+def _plugin(monkeypatch, snapshots, urls):
+    """Plugin whose archive lookups are replaced by the given callables"""
+    plugin = Plugin(target='example.com')
+    calls = {'snapshots': 0, 'cdx': []}
+
+    async def fetch_snapshots(params):
+        calls['snapshots'] += 1
+        return snapshots(params)
+
+    async def fetch_urls(params):
+        calls['cdx'].append(params['limit'])
+        return urls(params)
+
+    monkeypatch.setattr(plugin, '_fetch_snapshots', fetch_snapshots)
+    monkeypatch.setattr(plugin, '_fetch_urls', fetch_urls)
+    return plugin, calls
+
+
+def _fail(params):
+    raise ConnectionError('archive unreachable')
+
+
+def _one_url(params):
+    return [{'url': 'https://example.com/', 'timestamp': '20200101000000', 'status': '200'}]
+
+
+def test_failed_lookup_still_runs_cdx(monkeypatch):
+    plugin, calls = _plugin(monkeypatch, snapshots=_fail, urls=_one_url)
+
+    findings = asyncio.run(plugin.execute())
+
+    assert calls['cdx'] == [1, 1000]
+    assert findings['urls'] == _one_url({})
+    assert 'snapshots' in findings['error']
+
+
+def test_failed_probe_still_runs_cdx(monkeypatch):
+    probes = iter([_fail, _one_url])
+    plugin, calls = _plugin(monkeypatch, snapshots=lambda params: [], urls=lambda params: next(probes)(params))
+
+    findings = asyncio.run(plugin.execute())
+
+    assert calls['cdx'] == [1, 1000]
+    assert findings['urls'] == _one_url({})
+
+
+def test_empty_probe_skips_cdx_scan(monkeypatch):
+    plugin, calls = _plugin(monkeypatch, snapshots=lambda params: [], urls=lambda params: [])
+
+    findings = asyncio.run(plugin.execute())
+
+    assert calls['cdx'] == [1]
+    assert findings['urls'] == []
+
+
+def test_failures_are_not_cached(monkeypatch, cache_dir):
+    plugin, calls = _plugin(monkeypatch, snapshots=_fail, urls=_fail)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(plugin._get_snapshots('example.com'))
+
+    assert list(cache_dir.iterdir()) == []
+
+    monkeypatch.setattr(plugin, '_fetch_snapshots', lambda params: asyncio.sleep(0, result=[]))
+    assert asyncio.run(plugin._get_snapshots('example.com')) == []
+    assert len(list(cache_dir.iterdir())) == 1